@@ -38,19 +38,114 @@ Configuration:
 """
 
 import os
-import glob
 import sys
-import time
-import json
 import re
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional, Callable, Iterable, Iterator, TextIO
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the standard library is used instead
+    orjson = None
+
+# Parsed configuration per absolute config file path; the path is relative
+# to the working directory, which changes when a new project is started
+_CONFIG_CACHE: Dict[str, Dict[str, Any]] = {}
+
+# Separator of comma-separated user input, absorbing surrounding whitespace
+_CSV_SPLIT = re.compile(r'\s*,\s*')
+
+# How clear_screen() clears: 'ansi', 'cls' or 'none', decided on first call
+_CLEAR_METHOD: Optional[str] = None
+
+# Valid project/target names: ASCII letters, digits and underscores only
+_VALID_NAME_RE = re.compile(r'\A[A-Za-z0-9_]+\Z')
+
+# Directories that are never searched for source files
+_EXCLUDED_DIRS = frozenset({'obj', 'build', 'target', 'node_modules', '__pycache__'})
+
+# Source scan results keyed by (cwd, lang): ({directory: mtime}, (src_files, header_files))
+_SOURCE_CACHE: Dict[Tuple[str, str], Tuple[Dict[str, int], Tuple[List[str], List[str]]]] = {}
+
+# Fewest top-level subdirectories worth walking on a thread pool
+_PARALLEL_SCAN_MIN_DIRS = 3
+
+# Sidecar that persists _SOURCE_CACHE between runs, one per project directory
+_SOURCE_CACHE_FILE = '.maker-cache.json'
+
+# Working directories whose cache entries changed since the sidecar was read
+_SOURCE_CACHE_DIRTY = set()
+
+# Lowercase file extension (without the dot) -> 0 for sources, 1 for headers, per language.
+# Upper-case 'C' and 'H' are kept as-is: GCC treats a.C and a.H as C++.
+_SOURCE_EXTENSIONS = {
+    'C': {'c': 0, 'h': 1},
+    'C++': {'cpp': 0, 'cc': 0, 'cxx': 0, 'c++': 0, 'C': 0, 'hpp': 1, 'hh': 1, 'hxx': 1, 'h': 1, 'H': 1},
+    'Java': {'java': 0},
+}
+
+# Extensions whose case is significant, looked up before lowercasing
+_CASE_SENSITIVE_EXTS = frozenset({'C', 'H'})
+
+# Compiler, source extension, CMake standard and CMake language for C/C++
+_LANG_SPEC = {
+    'C': ('gcc', 'c', 'C_STANDARD 11', 'C'),
+    'C++': ('g++', 'cpp', 'CXX_STANDARD 17', 'CXX'),
+}
+
+# Architecture menu entries in display order: (choice, architecture, label)
+_ARCH_CHOICES = (('1', '64', '64-bit'), ('2', '32', '32-bit'), ('3', 'native', 'Native'))
+_CHOICE_TO_ARCH = {choice: arch for choice, arch, _ in _ARCH_CHOICES}
+
+# Rendered architecture menu and its default choice, keyed by default architecture
+_ARCH_MENU = {
+    default: (
+        "\nSelect target architecture:\n" + "\n".join(
+            f"{choice}. {label}{' (default)' if arch == default else ''}"
+            for choice, arch, label in _ARCH_CHOICES),
+        default_choice)
+    for default_choice, default, _ in _ARCH_CHOICES
+}
+
+# Architecture flag appended to CFLAGS ('native' adds nothing)
+_ARCH_FLAG = {'32': ' -m32', '64': ' -m64', 'native': ''}
+
+# Architecture block appended to CMakeLists.txt ('native' adds nothing)
+_CMAKE_ARCH_FLAGS = {
+    '32': "\n# Set architecture to 32-bit\nset(CMAKE_C_FLAGS \"${CMAKE_C_FLAGS} -m32\")\nset(CMAKE_CXX_FLAGS \"${CMAKE_CXX_FLAGS} -m32\")",
+    '64': "\n# Set architecture to 64-bit\nset(CMAKE_C_FLAGS \"${CMAKE_C_FLAGS} -m64\")\nset(CMAKE_CXX_FLAGS \"${CMAKE_CXX_FLAGS} -m64\")",
+    'native': '',
+}
+
+def _enable_windows_vt() -> bool:
+    """
+    Turn on ANSI escape sequence processing for the Windows console.
+    
+    Returns:
+        bool: True if the console now interprets escape sequences
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+        
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = wintypes.DWORD()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING, available since Windows 10
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (ImportError, AttributeError, OSError):
+        return False
 
 def clear_screen():
     """
     Clear the terminal screen in a cross-platform manner.
     
-    Uses 'cls' command on Windows and 'clear' command on Unix-like systems.
-    This provides a consistent user experience across different operating systems.
+    Writes the ANSI "cursor home, erase display" sequence directly instead
+    of spawning a shell. On Windows the console's VT mode is enabled first;
+    consoles that predate it fall back to the 'cls' command. Nothing is
+    written when stdout is redirected or TERM is 'dumb', so logs and pipes
+    stay free of escape codes.
     
     Returns:
         None
@@ -58,7 +153,173 @@ def clear_screen():
     Example:
         >>> clear_screen()  # Screen is cleared
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
+    global _CLEAR_METHOD
+    if _CLEAR_METHOD is None:
+        if not sys.stdout.isatty() or os.environ.get('TERM') == 'dumb':
+            _CLEAR_METHOD = 'none'
+        elif os.name != 'nt' or _enable_windows_vt():
+            _CLEAR_METHOD = 'ansi'
+        else:
+            _CLEAR_METHOD = 'cls'
+    
+    if _CLEAR_METHOD == 'ansi':
+        sys.stdout.write('\x1b[H\x1b[2J')
+        sys.stdout.flush()
+    elif _CLEAR_METHOD == 'cls':
+        os.system('cls')
+
+def _banner(title: str) -> str:
+    """Return a title centered between two 60-column rules, followed by a blank line."""
+    rule = "=" * 60
+    return f"{rule}\n{title.center(60)}\n{rule}\n"
+
+# Screen headers, formatted once at import
+_MAIN_HEADER = _banner("Build System Generator")
+_CONFIG_HEADER = _banner("Configuration Management")
+_FLAGS_HEADER = _banner("Compiler Flags Management")
+
+# Main menu body, written in one call on every pass of the menu loop
+_MENU_STR = (
+    "Main Menu:\n"
+    "1. Show source files summary\n"
+    "2. Generate traditional Makefile\n"
+    "3. Generate CMake files\n"
+    "4. Generate advanced Java Makefile\n"
+    "5. Start new project\n"
+    "6. Configuration Management\n"
+    "7. Generate database schema\n"
+    "8. Rescan source files\n"
+    "9. Exit\n"
+    "\nChoice: "
+)
+
+# Sub-menus of the configuration screen
+_CONFIG_ARCH_PROMPT = "\nSelect default architecture:\n" + "".join(
+    f"{choice}. {label}\n" for choice, _, label in _ARCH_CHOICES
+) + "Choice: "
+_BUILD_SYSTEM_PROMPT = "\nSelect preferred build system:\n1. Make\n2. CMake\nChoice: "
+_FLAGS_MENU = (
+    "1. Edit C flags\n"
+    "2. Edit C++ flags\n"
+    "3. Edit Java flags\n"
+    "4. Return to config menu\n"
+    "Choice: "
+)
+
+# Language menu shared by the build and new-project choices
+_LANG_CHOICES = {'1': 'C', '2': 'C++', '3': 'Java'}
+_LANG_PROMPT = "\nSelect language:\n1. C\n2. C++\n3. Java\n\nChoice: "
+
+# Opening text of the advanced Java and database schema dialogs
+_JAVA_OPTIONS_HEADER = "\n" + "=" * 50 + "\nAdvanced Java Build Configuration\n" + "=" * 50 + "\n"
+_DB_TYPE_MENU = (
+    "\n" + "=" * 60 + "\nDatabase Schema Generation Configuration\n" + "=" * 60 + "\n"
+    "\nSelect database type:\n"
+    "1. MySQL\n"
+    "2. MariaDB\n"
+)
+_DB_LANG_MENU = (
+    "\nSelect source language:\n"
+    "1. C (parse structs from .h files)\n"
+    "2. C++ (parse classes from .hpp/.h files)\n"
+    "3. Java (parse classes from .java files)\n"
+)
+
+def _prompt(message: str) -> str:
+    """
+    Read a menu choice from stdin without the overhead of input().
+    
+    Writes the prompt, then reads a single line directly with
+    sys.stdin.readline(). Used for short menu choices where line editing
+    and history add nothing; free-text entries still use input().
+    
+    Args:
+        message (str): Prompt text to display
+    
+    Returns:
+        str: The entered line with surrounding whitespace removed
+    
+    Raises:
+        EOFError: If stdin is closed, matching input()
+    """
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.strip()
+
+def _write_file(path: str, data, sync: bool = False):
+    """
+    Write text or bytes to a file with a single unbuffered write.
+    
+    Text is encoded as UTF-8 and newlines are written as-is, so generated
+    files are identical on every platform. New files get mode 0o666 less
+    the umask, as with open().
+    
+    Args:
+        path (str): Destination file path (created or truncated)
+        data (str | bytes): Content to write
+        sync (bool, optional): Flush the data to disk before returning.
+            Defaults to False.
+    
+    Returns:
+        None
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if sync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize an object to indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    import json
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _write_if_changed(path: str, content: str) -> bool:
+    """
+    Write a generated file only when it differs from the copy on disk.
+    
+    Leaving an up-to-date file untouched preserves its modification time,
+    so make and cmake do not treat a regenerated but identical build file
+    as a reason to rebuild. The size is checked first so a changed file is
+    usually detected without reading it.
+    
+    Args:
+        path (str): Destination file path
+        content (str): Complete file content
+    
+    Returns:
+        bool: True if the file was written, False if it was already current
+    """
+    data = content.encode('utf-8')
+    try:
+        if os.stat(path).st_size == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    
+    _write_file(path, data)
+    return True
 
 def load_config() -> Dict[str, Any]:
     """
@@ -68,6 +329,10 @@ def load_config() -> Dict[str, Any]:
     settings to ensure all required keys are present. If the config file
     doesn't exist or is corrupted, returns default configuration.
     
+    The parsed result is cached per working directory for the lifetime of
+    the process, so each directory's file is read at most once. The returned
+    dictionary is shared; callers that modify it should work on a copy.
+    
     Returns:
         Dict[str, Any]: Configuration dictionary containing:
             - default_architecture: Target architecture ('32', '64', 'native')
@@ -86,6 +351,11 @@ def load_config() -> Dict[str, Any]:
         '64'
     """
     config_file = 'maker_config.json'
+    cache_key = os.path.abspath(config_file)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
     default_config = {
         'default_architecture': '64',
         'default_compiler_flags': {
@@ -101,23 +371,35 @@ def load_config() -> Dict[str, Any]:
     
     if os.path.exists(config_file):
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-                # Merge with defaults to ensure all keys exist
-                for key, value in default_config.items():
-                    if key not in config:
-                        config[key] = value
-                return config
-        except (json.JSONDecodeError, FileNotFoundError):
+            with open(config_file, 'rb') as f:
+                config = _json_loads(f.read())
+            # Merge with defaults to ensure all keys exist, including
+            # compiler flags for languages missing from the file
+            merged = {**default_config, **config}
+            merged['default_compiler_flags'] = {
+                **default_config['default_compiler_flags'],
+                **config.get('default_compiler_flags', {})
+            }
+            _CONFIG_CACHE[cache_key] = merged
+            return merged
+        except (ValueError, OSError):
             print(f"Warning: Invalid config file. Using defaults.")
     
+    _CONFIG_CACHE[cache_key] = default_config
     return default_config
 
+def _invalidate_config():
+    """Drop the cached configuration so the next load_config() re-reads the file."""
+    _CONFIG_CACHE.clear()
+
 def save_config(config: Dict[str, Any]):
     """
     Save configuration settings to maker_config.json file.
     
     Persists the current configuration dictionary to disk as JSON.
+    The file is written to a temporary name and then renamed over the
+    original, so an interrupted save never leaves a truncated config. The
+    original's permission bits are kept.
     Handles file writing errors gracefully with user feedback.
     
     Args:
@@ -137,12 +419,43 @@ def save_config(config: Dict[str, Any]):
     """
     config_file = 'maker_config.json'
     try:
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        tmp_file = config_file + '.tmp'
+        _write_file(tmp_file, _json_dumps(config), sync=True)
+        # Carry over a mode the user set on the config (e.g. 0600) through the rename
+        try:
+            os.chmod(tmp_file, os.stat(config_file).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_file, config_file)
+        _CONFIG_CACHE[os.path.abspath(config_file)] = config
         print(f"Configuration saved to {config_file}")
     except Exception as e:
         print(f"Error saving config: {e}")
 
+def _choose_arch(config: Dict[str, Any]):
+    """Configuration option 1: pick the default target architecture."""
+    arch_choice = _prompt(_CONFIG_ARCH_PROMPT)
+    if arch_choice in _CHOICE_TO_ARCH:
+        config['default_architecture'] = _CHOICE_TO_ARCH[arch_choice]
+
+def _choose_project_dir(config: Dict[str, Any]):
+    """Configuration option 2: set the default new-project directory."""
+    new_dir = input(f"Enter default project directory [{config['default_project_dir']}]: ").strip()
+    if new_dir:
+        config['default_project_dir'] = new_dir
+
+def _choose_build_system(config: Dict[str, Any]):
+    """Configuration option 3: pick the preferred build system."""
+    build_choice = _prompt(_BUILD_SYSTEM_PROMPT)
+    if build_choice == '1':
+        config['preferred_build_system'] = 'make'
+    elif build_choice == '2':
+        config['preferred_build_system'] = 'cmake'
+
+def _toggle_auto_dirs(config: Dict[str, Any]):
+    """Configuration option 4: toggle automatic directory creation."""
+    config['auto_create_directories'] = not config['auto_create_directories']
+
 def manage_config():
     """
     Interactive configuration management interface.
@@ -167,58 +480,32 @@ def manage_config():
     Example:
         >>> manage_config()  # Opens interactive configuration menu
     """
-    config = load_config()
+    import copy
+    import time
+    
+    # Edit a private copy so cancelled changes never leak into the cache
+    config = copy.deepcopy(load_config())
     
     while True:
         clear_screen()
-        print("=" * 60)
-        print("Configuration Management".center(60))
-        print("=" * 60)
-        print()
+        choice = _prompt(
+            f"{_CONFIG_HEADER}\n"
+            "Current Configuration:\n"
+            f"1. Default Architecture: {config['default_architecture']}\n"
+            f"2. Default Project Directory: {config['default_project_dir']}\n"
+            f"3. Preferred Build System: {config['preferred_build_system']}\n"
+            f"4. Auto Create Directories: {config['auto_create_directories']}\n"
+            "5. Manage Compiler Flags\n"
+            "6. Save and Return to Main Menu\n"
+            "7. Cancel and Return to Main Menu (without saving)\n"
+            "8. Reset to Defaults\n"
+            "\n"
+            "Choice: "
+        )
         
-        print("Current Configuration:")
-        print(f"1. Default Architecture: {config['default_architecture']}")
-        print(f"2. Default Project Directory: {config['default_project_dir']}")
-        print(f"3. Preferred Build System: {config['preferred_build_system']}")
-        print(f"4. Auto Create Directories: {config['auto_create_directories']}")
-        print("5. Manage Compiler Flags")
-        print("6. Save and Return to Main Menu")
-        print("7. Cancel and Return to Main Menu (without saving)")
-        print("8. Reset to Defaults")
-        print()
-        
-        choice = input("Choice: ").strip()
-        
-        if choice == '1':
-            print("\nSelect default architecture:")
-            print("1. 64-bit")
-            print("2. 32-bit")
-            print("3. Native")
-            arch_choice = input("Choice: ").strip()
-            arch_map = {'1': '64', '2': '32', '3': 'native'}
-            if arch_choice in arch_map:
-                config['default_architecture'] = arch_map[arch_choice]
-                
-        elif choice == '2':
-            new_dir = input(f"Enter default project directory [{config['default_project_dir']}]: ").strip()
-            if new_dir:
-                config['default_project_dir'] = new_dir
-                
-        elif choice == '3':
-            print("\nSelect preferred build system:")
-            print("1. Make")
-            print("2. CMake")
-            build_choice = input("Choice: ").strip()
-            if build_choice == '1':
-                config['preferred_build_system'] = 'make'
-            elif build_choice == '2':
-                config['preferred_build_system'] = 'cmake'
-                
-        elif choice == '4':
-            config['auto_create_directories'] = not config['auto_create_directories']
-            
-        elif choice == '5':
-            manage_compiler_flags(config)
+        handler = _CONFIG_HANDLERS.get(choice)
+        if handler is not None:
+            handler(config)
             
         elif choice == '6':
             save_config(config)
@@ -230,7 +517,8 @@ def manage_config():
             break
             
         elif choice == '8':
-            config = load_config()  # Reset to defaults
+            _invalidate_config()
+            config = copy.deepcopy(load_config())  # Reset to defaults
             print("Configuration reset to defaults.")
             time.sleep(1)
             
@@ -262,43 +550,42 @@ def manage_compiler_flags(config: Dict[str, Any]):
         >>> config = load_config()
         >>> manage_compiler_flags(config)  # Opens flags management menu
     """
+    import time
+    
+    flags = config['default_compiler_flags']
     while True:
         clear_screen()
-        print("=" * 60)
-        print("Compiler Flags Management".center(60))
-        print("=" * 60)
-        print()
-        
-        print("Current Compiler Flags:")
-        for lang, flags in config['default_compiler_flags'].items():
-            print(f"{lang}: {flags}")
-        print()
-        
-        print("1. Edit C flags")
-        print("2. Edit C++ flags")
-        print("3. Edit Java flags")
-        print("4. Return to config menu")
-        
-        choice = input("Choice: ").strip()
+        current = "".join(f"{lang}: {lang_flags}\n" for lang, lang_flags in flags.items())
+        choice = _prompt(f"{_FLAGS_HEADER}\nCurrent Compiler Flags:\n{current}\n{_FLAGS_MENU}")
         
         if choice == '1':
-            new_flags = input(f"Enter C flags [{config['default_compiler_flags']['C']}]: ").strip()
+            new_flags = input(f"Enter C flags [{flags['C']}]: ").strip()
             if new_flags:
-                config['default_compiler_flags']['C'] = new_flags
+                flags['C'] = new_flags
         elif choice == '2':
-            new_flags = input(f"Enter C++ flags [{config['default_compiler_flags']['C++']}]: ").strip()
+            new_flags = input(f"Enter C++ flags [{flags['C++']}]: ").strip()
             if new_flags:
-                config['default_compiler_flags']['C++'] = new_flags
+                flags['C++'] = new_flags
         elif choice == '3':
-            new_flags = input(f"Enter Java flags [{config['default_compiler_flags']['Java']}]: ").strip()
+            new_flags = input(f"Enter Java flags [{flags['Java']}]: ").strip()
             if new_flags:
-                config['default_compiler_flags']['Java'] = new_flags
+                flags['Java'] = new_flags
         elif choice == '4':
             break
         else:
             print("Invalid choice!")
             time.sleep(1)
 
+# Configuration menu choices that edit the working copy in place. Save,
+# cancel and reset are handled by manage_config itself.
+_CONFIG_HANDLERS = {
+    '1': _choose_arch,
+    '2': _choose_project_dir,
+    '3': _choose_build_system,
+    '4': _toggle_auto_dirs,
+    '5': manage_compiler_flags,
+}
+
 def print_header():
     """
     Print the program header with title and decorative formatting.
@@ -317,12 +604,9 @@ def print_header():
     Example:
         >>> print_header()  # Prints formatted header
     """
-    print("=" * 60)
-    print("Build System Generator".center(60))
-    print("=" * 60)
-    print()
+    print(_MAIN_HEADER)
 
-def get_dir_name() -> str:
+def get_dir_name(config: Dict[str, Any]) -> str:
     """
     Get project directory name from user input with validation.
     
@@ -330,6 +614,9 @@ def get_dir_name() -> str:
     default taken from configuration settings. Validates that the name
     contains only alphanumeric characters and underscores.
     
+    Args:
+        config (Dict[str, Any]): Configuration loaded once by the caller
+    
     Returns:
         str: Valid directory name for the project
     
@@ -339,12 +626,11 @@ def get_dir_name() -> str:
         - Will be used as both directory name and default project name
     
     Example:
-        >>> dir_name = get_dir_name()
+        >>> dir_name = get_dir_name(load_config())
         Enter directory for project [default: new_project]: my_project
         >>> print(dir_name)
         'my_project'
     """
-    config = load_config()
     default_name = config['default_project_dir']
     while True:        
         print(f"\nEnter directory for project [default: {default_name}]: ", end='')
@@ -352,7 +638,7 @@ def get_dir_name() -> str:
         name = input().strip()
         if not name:
             return default_name
-        if name.isalnum() or '_' in name:
+        if _VALID_NAME_RE.match(name):
             return name
         print("Invalid name! Use only alphanumeric characters and underscores.")
 
@@ -384,11 +670,11 @@ def get_target_name() -> str:
         name = input().strip()
         if not name:
             return default_name
-        if name.isalnum() or '_' in name:
+        if _VALID_NAME_RE.match(name):
             return name
         print("Invalid name! Use only alphanumeric characters and underscores.")
 
-def get_target_architecture() -> str:
+def get_target_architecture(config: Dict[str, Any]) -> str:
     """
     Get target architecture from user input with configuration defaults.
     
@@ -396,6 +682,9 @@ def get_target_architecture() -> str:
     with the default value taken from configuration settings. The selection
     determines compiler flags added to the build system.
     
+    Args:
+        config (Dict[str, Any]): Configuration loaded once by the caller
+    
     Returns:
         str: Target architecture ('32', '64', or 'native')
     
@@ -405,7 +694,7 @@ def get_target_architecture() -> str:
         - 'native': Native targeting (no architecture flag)
     
     Example:
-        >>> arch = get_target_architecture()
+        >>> arch = get_target_architecture(load_config())
         Select target architecture:
         1. 64-bit (default)
         2. 32-bit
@@ -414,29 +703,33 @@ def get_target_architecture() -> str:
         >>> print(arch)
         '32'
     """
-    config = load_config()
     default_arch = config['default_architecture']
+    if default_arch not in _ARCH_MENU:
+        default_arch = '64'
     
-    arch_map = {'64': '1', '32': '2', 'native': '3'}
-    default_choice = arch_map.get(default_arch, '1')
-    
-    print("\nSelect target architecture:")
-    print(f"1. 64-bit {'(default)' if default_arch == '64' else ''}")
-    print(f"2. 32-bit {'(default)' if default_arch == '32' else ''}")
-    print(f"3. Native {'(default)' if default_arch == 'native' else ''}")
+    menu, default_choice = _ARCH_MENU[default_arch]
+    print(menu)
     
     while True:
-        choice = input(f"\nChoice [{default_choice}]: ").strip()
+        choice = _prompt(f"\nChoice [{default_choice}]: ")
         if not choice:
             return default_arch
-        elif choice == '1':
-            return '64'
-        elif choice == '2':
-            return '32'
-        elif choice == '3':
-            return 'native'
-        else:
-            print("Invalid choice! Please enter 1, 2, or 3.")
+        if choice in _CHOICE_TO_ARCH:
+            return _CHOICE_TO_ARCH[choice]
+        print("Invalid choice! Please enter 1, 2, or 3.")
+
+def _parse_csv(text: str) -> List[str]:
+    """
+    Split comma-separated user input into trimmed, non-empty entries.
+    
+    Args:
+        text (str): Raw input, e.g. "src, test/src,"
+    
+    Returns:
+        List[str]: Entries in input order, e.g. ['src', 'test/src']
+    """
+    text = text.strip()
+    return [item for item in _CSV_SPLIT.split(text) if item] if text else []
 
 def get_java_build_options() -> Dict[str, Any]:
     """
@@ -461,9 +754,7 @@ def get_java_build_options() -> Dict[str, Any]:
         >>> print(options['main_class'])
         'com.example.MainApp'
     """
-    print("\n" + "=" * 50)
-    print("Advanced Java Build Configuration")
-    print("=" * 50)
+    sys.stdout.write(_JAVA_OPTIONS_HEADER)
     
     options = {}
     
@@ -473,27 +764,15 @@ def get_java_build_options() -> Dict[str, Any]:
     
     # Source directories
     print("\nSource directories (comma-separated, press Enter for 'src'):")
-    src_input = input("Source dirs: ").strip()
-    if src_input:
-        options['source_dirs'] = [d.strip() for d in src_input.split(',')]
-    else:
-        options['source_dirs'] = ['src']
+    options['source_dirs'] = _parse_csv(input("Source dirs: ")) or ['src']
     
     # External JAR dependencies
     print("\nExternal JAR files (comma-separated, press Enter for none):")
-    jar_input = input("JAR files: ").strip()
-    if jar_input:
-        options['external_jars'] = [j.strip() for j in jar_input.split(',')]
-    else:
-        options['external_jars'] = []
+    options['external_jars'] = _parse_csv(input("JAR files: "))
     
     # Additional classpath
     print("\nAdditional classpath entries (comma-separated, press Enter for none):")
-    cp_input = input("Classpath: ").strip()
-    if cp_input:
-        options['classpath'] = [c.strip() for c in cp_input.split(',')]
-    else:
-        options['classpath'] = []
+    options['classpath'] = _parse_csv(input("Classpath: "))
     
     # Compiler options
     print("\nAdditional JavaC options (press Enter for defaults):")
@@ -502,7 +781,7 @@ def get_java_build_options() -> Dict[str, Any]:
     options['compiler_opts'] = comp_input if comp_input else ''
     
     # JAR creation
-    create_jar = input("\nCreate JAR file? [y/N]: ").strip().lower()
+    create_jar = _prompt("\nCreate JAR file? [y/N]: ").lower()
     options['create_jar'] = create_jar in ['y', 'yes']
     
     # Manifest file
@@ -514,7 +793,8 @@ def get_java_build_options() -> Dict[str, Any]:
     
     return options
 
-def generate_advanced_java_makefile(target_name: str, java_options: Dict[str, Any]):
+def generate_advanced_java_makefile(target_name: str, java_options: Dict[str, Any],
+                                    config: Dict[str, Any]):
     """
     Generate an advanced Java Makefile with comprehensive build features.
     
@@ -525,6 +805,7 @@ def generate_advanced_java_makefile(target_name: str, java_options: Dict[str, An
     Args:
         target_name (str): Name of the target project/JAR
         java_options (Dict[str, Any]): Java build configuration options
+        config (Dict[str, Any]): Configuration loaded once by the caller
     
     Returns:
         None: Creates advanced Makefile in current directory
@@ -541,10 +822,9 @@ def generate_advanced_java_makefile(target_name: str, java_options: Dict[str, An
     
     Example:
         >>> java_opts = get_java_build_options()
-        >>> generate_advanced_java_makefile('MyApp', java_opts)
+        >>> generate_advanced_java_makefile('MyApp', java_opts, load_config())
         # Creates advanced Java Makefile with all features
     """
-    config = load_config()
     
     # Build source directories list
     src_dirs = ' '.join(java_options['source_dirs'])
@@ -562,7 +842,7 @@ def generate_advanced_java_makefile(target_name: str, java_options: Dict[str, An
     base_flags = config['default_compiler_flags'].get('Java', '-Xlint:all')
     compiler_flags = f"{base_flags} {java_options['compiler_opts']}".strip()
     
-    makefile_content = f"""# Advanced Java Project Makefile
+    parts = [f"""# Advanced Java Project Makefile
 # Generated by Build System Generator
 
 # Project settings
@@ -619,18 +899,18 @@ $(CLASSES_DIR)/%.class: %.java
 	$(JAVAC) $(JAVAC_FLAGS) -cp "$(CP_PARTS)" -d $(CLASSES_DIR) $<
 
 # Create JAR file
-{"jar: compile $(DIST_DIR)" if java_options['create_jar'] else "# JAR creation disabled"}"""
+{"jar: compile $(DIST_DIR)" if java_options['create_jar'] else "# JAR creation disabled"}"""]
 
     if java_options['create_jar']:
         if java_options['manifest_file']:
-            makefile_content += f"""
-	$(JAR) cfm $(DIST_DIR)/$(PROJECT_NAME).jar {java_options['manifest_file']} -C $(CLASSES_DIR) ."""
+            parts.append(f"""
+	$(JAR) cfm $(DIST_DIR)/$(PROJECT_NAME).jar {java_options['manifest_file']} -C $(CLASSES_DIR) .""")
         else:
-            makefile_content += f"""
+            parts.append(f"""
 	echo "Main-Class: $(MAIN_CLASS)" > $(BUILD_DIR)/MANIFEST.MF
-	$(JAR) cfm $(DIST_DIR)/$(PROJECT_NAME).jar $(BUILD_DIR)/MANIFEST.MF -C $(CLASSES_DIR) ."""
+	$(JAR) cfm $(DIST_DIR)/$(PROJECT_NAME).jar $(BUILD_DIR)/MANIFEST.MF -C $(CLASSES_DIR) .""")
 
-    makefile_content += f"""
+    parts.append(f"""
 
 # Run the application
 run: compile
@@ -682,22 +962,18 @@ help:
 
 # Phony targets
 .PHONY: all compile{"" if not java_options['create_jar'] else " jar"} run{"" if not java_options['create_jar'] else " run-jar"} clean rebuild info install-deps src-package help
-"""
+""")
 
-    with open('Makefile', 'w') as f:
-        f.write(makefile_content)
+    _write_if_changed('Makefile', ''.join(parts))
     
-    # Create build directory structure
-    os.makedirs('build/classes', exist_ok=True)
+    # Create the build tree, source directories and lib directory for
+    # external JARs, each once; sorting creates parents before children
+    dirs = {'build/classes', 'lib'}
+    dirs.update(java_options['source_dirs'])
     if java_options['create_jar']:
-        os.makedirs('build/dist', exist_ok=True)
-    
-    # Create source directories if they don't exist
-    for src_dir in java_options['source_dirs']:
-        os.makedirs(src_dir, exist_ok=True)
-    
-    # Create lib directory for external JARs
-    os.makedirs('lib', exist_ok=True)
+        dirs.add('build/dist')
+    for directory in sorted(dirs):
+        os.makedirs(directory, exist_ok=True)
 
 # Database Schema Generation System
 class DatabaseType:
@@ -708,6 +984,8 @@ class DatabaseType:
 
 class DataType:
     """Represents a data type with language-specific mapping to SQL types."""
+    __slots__ = ('name', 'size', 'nullable')
+    
     def __init__(self, name: str, size: int = None, nullable: bool = True):
         self.name = name
         self.size = size
@@ -718,6 +996,9 @@ class DataType:
 
 class Field:
     """Represents a field/column in a database table."""
+    __slots__ = ('name', 'data_type', 'is_primary_key', 'is_foreign_key',
+                 'foreign_table', 'default_value', 'comment')
+    
     def __init__(self, name: str, data_type: DataType, is_primary_key: bool = False, 
                  is_foreign_key: bool = False, foreign_table: str = None, 
                  default_value: str = None, comment: str = None):
@@ -731,11 +1012,258 @@ class Field:
 
 class Table:
     """Represents a database table with fields and metadata."""
+    __slots__ = ('name', 'fields', 'comment')
+    
     def __init__(self, name: str, fields: List[Field], comment: str = None):
         self.name = name
         self.fields = fields
         self.comment = comment
 
+# SQL types produced by the language maps below. DataType instances are
+# never mutated, so every field of a given type shares one instance.
+_SQL_INT = DataType('INT')
+_SQL_BIGINT = DataType('BIGINT')
+_SQL_SMALLINT = DataType('SMALLINT')
+_SQL_TINYINT = DataType('TINYINT')
+_SQL_CHAR = DataType('CHAR', 1)
+_SQL_FLOAT = DataType('FLOAT')
+_SQL_DOUBLE = DataType('DOUBLE')
+_SQL_VARCHAR = DataType('VARCHAR', 255)
+_SQL_BOOLEAN = DataType('BOOLEAN')
+_SQL_INT_UNSIGNED = DataType('INT UNSIGNED')
+_SQL_BIGINT_UNSIGNED = DataType('BIGINT UNSIGNED')
+_SQL_DECIMAL = DataType('DECIMAL', 10)
+_SQL_DATE = DataType('DATE')
+_SQL_TIMESTAMP = DataType('TIMESTAMP')
+
+# SQL type for types without a specific mapping
+_DEFAULT_SQL_TYPE = DataType('TEXT')
+
+# C type -> SQL type
+_C_SQL_MAP: Dict[str, DataType] = {
+    'int': _SQL_INT,
+    'long': _SQL_BIGINT,
+    'short': _SQL_SMALLINT,
+    'char': _SQL_CHAR,
+    'float': _SQL_FLOAT,
+    'double': _SQL_DOUBLE,
+    'char*': _SQL_VARCHAR,
+    'bool': _SQL_BOOLEAN,
+    'unsigned int': _SQL_INT_UNSIGNED,
+    'unsigned long': _SQL_BIGINT_UNSIGNED,
+}
+
+# C++ type -> SQL type
+_CPP_SQL_MAP: Dict[str, DataType] = {
+    'int': _SQL_INT,
+    'long': _SQL_BIGINT,
+    'short': _SQL_SMALLINT,
+    'char': _SQL_CHAR,
+    'float': _SQL_FLOAT,
+    'double': _SQL_DOUBLE,
+    'string': _SQL_VARCHAR,
+    'std::string': _SQL_VARCHAR,
+    'char*': _SQL_VARCHAR,
+    'bool': _SQL_BOOLEAN,
+    'unsigned': _SQL_INT_UNSIGNED,
+    'unsigned int': _SQL_INT_UNSIGNED,
+    'unsigned long': _SQL_BIGINT_UNSIGNED,
+    'unsigned long long': _SQL_BIGINT_UNSIGNED,
+    'long long': _SQL_BIGINT,
+    'size_t': _SQL_BIGINT_UNSIGNED,
+}
+
+# Java type -> SQL type
+_JAVA_SQL_MAP: Dict[str, DataType] = {
+    'int': _SQL_INT,
+    'Integer': _SQL_INT,
+    'long': _SQL_BIGINT,
+    'Long': _SQL_BIGINT,
+    'short': _SQL_SMALLINT,
+    'Short': _SQL_SMALLINT,
+    'char': _SQL_CHAR,
+    'Character': _SQL_CHAR,
+    'float': _SQL_FLOAT,
+    'Float': _SQL_FLOAT,
+    'double': _SQL_DOUBLE,
+    'Double': _SQL_DOUBLE,
+    'String': _SQL_VARCHAR,
+    'boolean': _SQL_BOOLEAN,
+    'Boolean': _SQL_BOOLEAN,
+    'byte': _SQL_TINYINT,
+    'Byte': _SQL_TINYINT,
+    'BigDecimal': _SQL_DECIMAL,
+    'Date': _SQL_DATE,
+    'Timestamp': _SQL_TIMESTAMP,
+}
+
+# Struct definitions scanned for by CodeStructureParser, matched against
+# file bytes with comments and string literals blanked
+_C_STRUCT_RE = re.compile(rb'typedef\s+struct\s*{([^}]+)}\s*(\w+);', re.DOTALL)
+
+# Comments and string/character literals, blanked before definitions are
+# scanned for so keywords and braces inside them are never matched
+_COMMENT_OR_LITERAL_RE = re.compile(
+    rb'//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])\'',
+    re.DOTALL
+)
+
+# A type as it appears in a base list: qualified name, optional type arguments
+_CLASS_BASE_TYPE = rb'[\w.:]+(?:\s*<[^{};()]*>)?'
+
+# Class name and header after the 'class' keyword, up to the opening brace.
+# The header may only hold type parameters, 'final', a C++ ': base-list'
+# or Java 'extends'/'implements' clauses; anything else, such as a ';' of a
+# forward declaration, means this is not a class definition.
+_CLASS_HEAD_RE = re.compile(
+    rb'\s+(\w+)('
+    rb'(?:\s*<[^{};()]*>)?'
+    rb'(?:\s+final)?'
+    rb'(?:\s*:\s*(?:(?:public|private|protected|virtual)\s+)*' + _CLASS_BASE_TYPE +
+    rb'(?:\s*,\s*(?:(?:public|private|protected|virtual)\s+)*' + _CLASS_BASE_TYPE + rb')*'
+    rb'|\s+extends\s+' + _CLASS_BASE_TYPE + rb'(?:\s*,\s*' + _CLASS_BASE_TYPE + rb')*)?'
+    rb'(?:\s+implements\s+' + _CLASS_BASE_TYPE + rb'(?:\s*,\s*' + _CLASS_BASE_TYPE + rb')*)?'
+    rb')\s*{'
+)
+
+# A header line that starts another declaration instead of continuing this one
+_CLASS_HEAD_BREAK_RE = re.compile(
+    rb'\n\s*(?:namespace|class|struct|union|enum|interface|typedef|template|using|package|import)\b'
+)
+
+# Line prefixes of class body lines that never declare a field. Java skips
+# annotations and public/private members as well as comments.
+_CPP_SKIP_PREFIXES = ('//', '/*', '*')
+_JAVA_SKIP_PREFIXES = ('//', '/*', '*', '@', 'public ', 'private ')
+
+# Access labels and modifiers stripped from member declarations
+_CPP_ACCESS_RE = re.compile(r'(?:public|private|protected):')
+_JAVA_MODIFIERS_RE = re.compile(r'\b(?:public|private|protected|static|final)\b\s*')
+
+# One C++ member declaration: leading qualifiers, a type that may span
+# several integer keywords or carry template arguments, cv-qualifiers placed
+# after the type or after the pointer/reference marks, and the first name.
+# Further declarators are picked up by _CPP_DECLARATOR_RE.
+_CPP_FIELD_RE = re.compile(
+    r'((?:(?:static|const|constexpr|mutable|volatile|inline)\s+)*)'
+    r'((?:(?:unsigned|signed|short|long)\s+)*[\w:]+\b(?:\s*<[^;]*>)?)'
+    r'(?:\s+(?:const|volatile)\b)*'
+    r'\s*([*&]*)(?:\s*\b(?:const|volatile)\b)*\s*(\w+)'
+)
+
+# Marks and name of each extra declarator in a C++ member declaration
+_CPP_DECLARATOR_RE = re.compile(r',\s*([*&]*)(?:\s*\b(?:const|volatile)\b)*\s*([A-Za-z_]\w*)')
+
+# Keywords that can never be a member name, only an incomplete declaration
+_CPP_NON_NAMES = frozenset({
+    'const', 'volatile', 'mutable', 'static', 'constexpr', 'inline',
+    'unsigned', 'signed', 'short', 'long',
+})
+
+# One C struct member declaration: multi-word type, optional pointer stars,
+# name and optional array suffix, then any further ', *name[N]' declarators.
+# Several declarations may share a line.
+_C_FIELD_RE = re.compile(
+    r'(?:^|(?<=;))[ \t]*(\w+(?:[ \t]+\w+)*?)(?:[ \t]*(\*+)[ \t]*|[ \t]+)(\w+)[ \t]*(?:\[[^\]\n]*\])?'
+    r'((?:[ \t]*,[ \t]*\**[ \t]*\w+[ \t]*(?:\[[^\]\n]*\])?)*)[ \t]*;',
+    re.MULTILINE
+)
+
+# Pointer stars and name of each extra declarator in a C member declaration
+_C_DECLARATOR_RE = re.compile(r',[ \t]*(\**)[ \t]*(\w+)')
+
+def _iter_class_bodies(content) -> Iterator[Tuple[bytes, bytes]]:
+    """
+    Find class definitions by matching braces instead of with one regex.
+    
+    Each 'class <Name> ... {' is followed to its closing brace, so methods
+    with bodies no longer cut the class short. Nested blocks (method bodies,
+    inner classes) and their headers are left out of the yielded body;
+    inner classes are yielded on their own.
+    
+    Args:
+        content: Source bytes or a memory map of them
+    
+    Returns:
+        Iterator[Tuple[bytes, bytes]]: (class name, top-level body text) pairs
+    """
+    pos = 0
+    while True:
+        start = content.find(b'class', pos)
+        if start < 0:
+            return
+        pos = start + 5
+        
+        # Skip identifiers that merely contain 'class' and Java's Foo.class
+        if start and (content[start - 1:start].isalnum() or content[start - 1:start] in b'_.$'):
+            continue
+        head = _CLASS_HEAD_RE.match(content, pos)
+        if head is None:
+            continue
+        # Reject template parameters ('<class T> class Foo') and headers that
+        # run on into the next declaration
+        header = head.group(2)
+        if b'class' in header or b'=' in header or _CLASS_HEAD_BREAK_RE.search(header):
+            continue
+        
+        segments = []
+        depth = 1
+        segment_start = i = pos = head.end()
+        while depth:
+            close = content.find(b'}', i)
+            if close < 0:
+                return
+            opening = content.find(b'{', i, close)
+            if opening >= 0:
+                if depth == 1:
+                    # Keep complete statements only, dropping the header of
+                    # the block being entered
+                    cut = content.rfind(b';', segment_start, opening)
+                    if cut >= 0:
+                        segments.append(content[segment_start:cut + 1])
+                depth += 1
+                i = opening + 1
+            else:
+                depth -= 1
+                if depth == 1:
+                    segment_start = close + 1
+                elif depth == 0:
+                    segments.append(content[segment_start:close])
+                i = close + 1
+        
+        yield head.group(1), b''.join(segments)
+
+def _blank_comment_or_literal(match) -> bytes:
+    """Replace a comment with the line breaks it spans and a literal with an empty one."""
+    text = match.group()
+    if text[:1] == b'/':
+        return b'\n' * text.count(b'\n')
+    return text[:1] * 2
+
+def _find_definitions(file_path: str, scan: Callable[[Any], Iterable[Tuple[bytes, ...]]]) -> List[Tuple[str, ...]]:
+    """
+    Return the decoded definitions a scanner finds in a file.
+    
+    The file is read as bytes and comments and string literals are blanked
+    in one pass, so a 'class' or ';' inside them is never taken for code. Comments keep their line breaks, leaving the line structure
+    of definitions intact.
+    
+    Args:
+        file_path (str): Path to the source file
+        scan: Callable taking the file bytes and returning tuples of byte
+            strings, e.g. a compiled pattern's findall or _iter_class_bodies
+    
+    Returns:
+        List[Tuple[str, ...]]: Each definition's pieces, decoded as UTF-8
+    """
+    with open(file_path, 'rb') as f:
+        content = _COMMENT_OR_LITERAL_RE.sub(_blank_comment_or_literal, f.read())
+    
+    return [
+        tuple(piece.decode('utf-8', 'replace') for piece in definition)
+        for definition in scan(content)
+    ]
+
 class CodeStructureParser:
     """Parser for extracting database schema information from code structures."""
     
@@ -753,25 +1281,15 @@ class CodeStructureParser:
         tables = []
         
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-            
-            # Simple regex to find struct definitions
-            import re
-            struct_pattern = r'typedef\s+struct\s*{([^}]+)}\s*(\w+);'
-            
-            for match in re.finditer(struct_pattern, content, re.DOTALL):
-                struct_body = match.group(1).strip()
-                struct_name = match.group(2)
-                
+            for struct_body, struct_name in _find_definitions(file_path, _C_STRUCT_RE.findall):
                 fields = []
-                for line in struct_body.split('\n'):
-                    line = line.strip()
-                    if line and not line.startswith('//') and not line.startswith('/*'):
-                        # Parse field definition
-                        field = CodeStructureParser._parse_c_field(line)
-                        if field:
-                            fields.append(field)
+                for field_match in _C_FIELD_RE.finditer(struct_body):
+                    c_type, stars, field_name, more = field_match.groups()
+                    c_type = ' '.join(c_type.split())
+                    fields.append(Field(field_name, CodeStructureParser._map_c_type_to_sql(c_type + (stars or ''))))
+                    # 'int b, *c;' declares one field per name, each with its own stars
+                    for more_stars, more_name in _C_DECLARATOR_RE.findall(more):
+                        fields.append(Field(more_name, CodeStructureParser._map_c_type_to_sql(c_type + more_stars)))
                 
                 if fields:
                     tables.append(Table(struct_name.lower(), fields, f"Generated from C struct {struct_name}"))
@@ -781,44 +1299,10 @@ class CodeStructureParser:
             
         return tables
     
-    @staticmethod
-    def _parse_c_field(line: str) -> Field:
-        """Parse a single C struct field line."""
-        import re
-        
-        # Remove semicolon and clean up
-        line = line.rstrip(';').strip()
-        
-        # Basic field parsing (type name)
-        parts = line.split()
-        if len(parts) >= 2:
-            c_type = parts[0]
-            field_name = parts[1]
-            
-            # Map C types to SQL types
-            sql_type = CodeStructureParser._map_c_type_to_sql(c_type)
-            
-            return Field(field_name, sql_type)
-        
-        return None
-    
     @staticmethod
     def _map_c_type_to_sql(c_type: str) -> DataType:
         """Map C data types to SQL data types."""
-        type_mapping = {
-            'int': DataType('INT'),
-            'long': DataType('BIGINT'),
-            'short': DataType('SMALLINT'),
-            'char': DataType('CHAR', 1),
-            'float': DataType('FLOAT'),
-            'double': DataType('DOUBLE'),
-            'char*': DataType('VARCHAR', 255),
-            'bool': DataType('BOOLEAN'),
-            'unsigned int': DataType('INT UNSIGNED'),
-            'unsigned long': DataType('BIGINT UNSIGNED'),
-        }
-        
-        return type_mapping.get(c_type, DataType('TEXT'))
+        return _C_SQL_MAP.get(c_type, _DEFAULT_SQL_TYPE)
     
     @staticmethod
     def parse_cpp_classes(file_path: str) -> List[Table]:
@@ -834,26 +1318,15 @@ class CodeStructureParser:
         tables = []
         
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-            
-            import re
-            # Find class definitions
-            class_pattern = r'class\s+(\w+)\s*{([^}]+)}'
-            
-            for match in re.finditer(class_pattern, content, re.DOTALL):
-                class_name = match.group(1)
-                class_body = match.group(2).strip()
-                
+            for class_name, class_body in _find_definitions(file_path, _iter_class_bodies):
                 fields = []
-                for line in class_body.split('\n'):
+                for line in class_body.splitlines():
                     line = line.strip()
-                    if line and not line.startswith('//') and not line.startswith('/*'):
-                        # Look for member variables (skip methods)
-                        if ';' in line and '(' not in line:
-                            field = CodeStructureParser._parse_cpp_field(line)
-                            if field:
-                                fields.append(field)
+                    if not line or line.startswith(_CPP_SKIP_PREFIXES):
+                        continue
+                    # Look for member variables (skip methods)
+                    if ';' in line and '(' not in line:
+                        fields.extend(CodeStructureParser._parse_cpp_fields(line))
                 
                 if fields:
                     tables.append(Table(class_name.lower(), fields, f"Generated from C++ class {class_name}"))
@@ -864,48 +1337,34 @@ class CodeStructureParser:
         return tables
     
     @staticmethod
-    def _parse_cpp_field(line: str) -> Field:
-        """Parse a single C++ class member variable line."""
-        import re
-        
+    def _parse_cpp_fields(line: str) -> List[Field]:
+        """Parse a C++ class member declaration line, one field per declarator (callers skip lines with '(')."""
         # Remove access specifiers and clean up
-        line = re.sub(r'(public|private|protected):', '', line)
+        line = _CPP_ACCESS_RE.sub('', line)
         line = line.rstrip(';').strip()
         
-        # Skip static, const, and other modifiers for now
-        if 'static' in line or 'const' in line or '(' in line:
-            return None
-            
-        parts = line.split()
-        if len(parts) >= 2:
-            cpp_type = parts[0]
-            field_name = parts[1]
-            
-            # Map C++ types to SQL types
-            sql_type = CodeStructureParser._map_cpp_type_to_sql(cpp_type)
-            
-            return Field(field_name, sql_type)
+        match = _CPP_FIELD_RE.match(line)
+        if match is None:
+            return []
+        qualifiers, cpp_type, marks, name = match.groups()
         
-        return None
+        # Static members belong to the class, not to each row
+        if 'static' in qualifiers or 'constexpr' in qualifiers or name in _CPP_NON_NAMES:
+            return []
+        
+        # Map C++ types to SQL types; 'int a, *b;' gives each name its own marks
+        if ' ' in cpp_type:
+            cpp_type = ' '.join(cpp_type.split())
+        fields = [Field(name, CodeStructureParser._map_cpp_type_to_sql(cpp_type + marks))]
+        for more_marks, more_name in _CPP_DECLARATOR_RE.findall(line, match.end()):
+            if more_name not in _CPP_NON_NAMES:
+                fields.append(Field(more_name, CodeStructureParser._map_cpp_type_to_sql(cpp_type + more_marks)))
+        return fields
     
     @staticmethod
     def _map_cpp_type_to_sql(cpp_type: str) -> DataType:
         """Map C++ data types to SQL data types."""
-        type_mapping = {
-            'int': DataType('INT'),
-            'long': DataType('BIGINT'),
-            'short': DataType('SMALLINT'),
-            'char': DataType('CHAR', 1),
-            'float': DataType('FLOAT'),
-            'double': DataType('DOUBLE'),
-            'string': DataType('VARCHAR', 255),
-            'std::string': DataType('VARCHAR', 255),
-            'bool': DataType('BOOLEAN'),
-            'unsigned': DataType('INT UNSIGNED'),
-            'size_t': DataType('BIGINT UNSIGNED'),
-        }
-        
-        return type_mapping.get(cpp_type, DataType('TEXT'))
+        return _CPP_SQL_MAP.get(cpp_type, _DEFAULT_SQL_TYPE)
     
     @staticmethod
     def parse_java_classes(file_path: str) -> List[Table]:
@@ -921,26 +1380,17 @@ class CodeStructureParser:
         tables = []
         
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-            
-            import re
-            # Find class definitions
-            class_pattern = r'public\s+class\s+(\w+)\s*{([^}]+)}'
-            
-            for match in re.finditer(class_pattern, content, re.DOTALL):
-                class_name = match.group(1)
-                class_body = match.group(2).strip()
-                
+            for class_name, class_body in _find_definitions(file_path, _iter_class_bodies):
                 fields = []
-                for line in class_body.split('\n'):
+                for line in class_body.splitlines():
                     line = line.strip()
-                    if line and not line.startswith('//') and not line.startswith('/*'):
-                        # Look for field declarations
-                        if ';' in line and '(' not in line and not line.startswith('public') and not line.startswith('private'):
-                            field = CodeStructureParser._parse_java_field(line)
-                            if field:
-                                fields.append(field)
+                    if not line or line.startswith(_JAVA_SKIP_PREFIXES):
+                        continue
+                    # Look for field declarations
+                    if ';' in line and '(' not in line:
+                        field = CodeStructureParser._parse_java_field(line)
+                        if field:
+                            fields.append(field)
                 
                 if fields:
                     tables.append(Table(class_name.lower(), fields, f"Generated from Java class {class_name}"))
@@ -952,52 +1402,25 @@ class CodeStructureParser:
     
     @staticmethod
     def _parse_java_field(line: str) -> Field:
-        """Parse a single Java class field line."""
-        import re
-        
+        """Parse a single Java class field line (callers skip lines with '(')."""
         # Remove modifiers and clean up
-        line = re.sub(r'(public|private|protected|static|final)', '', line)
+        line = _JAVA_MODIFIERS_RE.sub('', line)
         line = line.rstrip(';').strip()
         
-        parts = line.split()
-        if len(parts) >= 2:
-            java_type = parts[0]
-            field_name = parts[1]
-            
-            # Map Java types to SQL types
-            sql_type = CodeStructureParser._map_java_type_to_sql(java_type)
-            
-            return Field(field_name, sql_type)
+        # Only the type and name are used; stop splitting after them
+        parts = line.split(None, 2)
+        if len(parts) < 2:
+            return None
         
-        return None
+        # Map Java types to SQL types
+        sql_type = CodeStructureParser._map_java_type_to_sql(parts[0])
+        
+        return Field(parts[1], sql_type)
     
     @staticmethod
     def _map_java_type_to_sql(java_type: str) -> DataType:
         """Map Java data types to SQL data types."""
-        type_mapping = {
-            'int': DataType('INT'),
-            'Integer': DataType('INT'),
-            'long': DataType('BIGINT'),
-            'Long': DataType('BIGINT'),
-            'short': DataType('SMALLINT'),
-            'Short': DataType('SMALLINT'),
-            'char': DataType('CHAR', 1),
-            'Character': DataType('CHAR', 1),
-            'float': DataType('FLOAT'),
-            'Float': DataType('FLOAT'),
-            'double': DataType('DOUBLE'),
-            'Double': DataType('DOUBLE'),
-            'String': DataType('VARCHAR', 255),
-            'boolean': DataType('BOOLEAN'),
-            'Boolean': DataType('BOOLEAN'),
-            'byte': DataType('TINYINT'),
-            'Byte': DataType('TINYINT'),
-            'BigDecimal': DataType('DECIMAL', 10),
-            'Date': DataType('DATE'),
-            'Timestamp': DataType('TIMESTAMP'),
-        }
-        
-        return type_mapping.get(java_type, DataType('TEXT'))
+        return _JAVA_SQL_MAP.get(java_type, _DEFAULT_SQL_TYPE)
 
 class SQLGenerator:
     """Generator for SQL DDL statements from table definitions."""
@@ -1014,66 +1437,78 @@ class SQLGenerator:
         Returns:
             str: Complete SQL DDL script
         """
-        sql_lines = []
+        import io
+        
+        buffer = io.StringIO()
+        SQLGenerator.write_mysql_schema(tables, buffer, database_name)
+        return buffer.getvalue()
+    
+    @staticmethod
+    def write_mysql_schema(tables: List[Table], out: TextIO, database_name: str = None):
+        """
+        Write MySQL/MariaDB schema SQL for table definitions to a text stream.
+        
+        Each statement block is written as soon as it is formatted, so the
+        script is never assembled in memory as a whole.
+        
+        Args:
+            tables (List[Table]): List of table definitions
+            out (TextIO): Destination stream, e.g. an open output file
+            database_name (str, optional): Name of the database
+        """
+        # Blank line between blocks, none after the last
+        separator = ''
         
         # Database creation
         if database_name:
-            sql_lines.append(f"-- Database: {database_name}")
-            sql_lines.append(f"CREATE DATABASE IF NOT EXISTS `{database_name}`;")
-            sql_lines.append(f"USE `{database_name}`;")
-            sql_lines.append("")
+            out.write(f"-- Database: {database_name}\n"
+                      f"CREATE DATABASE IF NOT EXISTS `{database_name}`;\n"
+                      f"USE `{database_name}`;\n")
+            separator = '\n'
         
         # Table creation
         for table in tables:
-            sql_lines.append(f"-- Table: {table.name}")
+            out.write(separator)
+            separator = '\n'
+            out.write(f"-- Table: {table.name}\n")
             if table.comment:
-                sql_lines.append(f"-- {table.comment}")
+                out.write(f"-- {table.comment}\n")
             
-            sql_lines.append(f"CREATE TABLE IF NOT EXISTS `{table.name}` (")
+            out.write(f"CREATE TABLE IF NOT EXISTS `{table.name}` (\n")
             
-            # Fields
+            # Fields, collecting key columns in the same pass
             field_lines = []
+            primary_keys = []
+            foreign_keys = []
             for field in table.fields:
-                field_sql = SQLGenerator._generate_mysql_field(field)
-                field_lines.append(f"    {field_sql}")
+                field_lines.append(f"    {SQLGenerator._generate_mysql_field(field)}")
+                if field.is_primary_key:
+                    primary_keys.append(field.name)
+                if field.is_foreign_key and field.foreign_table:
+                    foreign_keys.append(field)
             
             # Primary keys
-            primary_keys = [f.name for f in table.fields if f.is_primary_key]
             if primary_keys:
                 field_lines.append(f"    PRIMARY KEY (`{'`, `'.join(primary_keys)}`)")
             
             # Foreign keys
-            for field in table.fields:
-                if field.is_foreign_key and field.foreign_table:
-                    field_lines.append(f"    FOREIGN KEY (`{field.name}`) REFERENCES `{field.foreign_table}`(`{field.name}`)")
+            for field in foreign_keys:
+                field_lines.append(f"    FOREIGN KEY (`{field.name}`) REFERENCES `{field.foreign_table}`(`{field.name}`)")
             
-            sql_lines.append(",\n".join(field_lines))
-            sql_lines.append(") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;")
-            sql_lines.append("")
-        
-        return "\n".join(sql_lines)
+            out.write(",\n".join(field_lines))
+            out.write("\n) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;\n")
     
     @staticmethod
     def _generate_mysql_field(field: Field) -> str:
         """Generate MySQL field definition."""
-        field_sql = f"`{field.name}` {field.data_type.name}"
-        
-        if field.data_type.size:
-            field_sql += f"({field.data_type.size})"
-        
-        if not field.data_type.nullable:
-            field_sql += " NOT NULL"
-        
-        if field.default_value:
-            field_sql += f" DEFAULT {field.default_value}"
-        
-        if field.is_primary_key:
-            field_sql += " AUTO_INCREMENT"
+        data_type = field.data_type
+        size = f"({data_type.size})" if data_type.size else ""
+        not_null = "" if data_type.nullable else " NOT NULL"
+        default = f" DEFAULT {field.default_value}" if field.default_value else ""
+        auto_increment = " AUTO_INCREMENT" if field.is_primary_key else ""
+        comment = f" COMMENT '{field.comment}'" if field.comment else ""
         
-        if field.comment:
-            field_sql += f" COMMENT '{field.comment}'"
-        
-        return field_sql
+        return f"`{field.name}` {data_type.name}{size}{not_null}{default}{auto_increment}{comment}"
 
 def get_database_options() -> Dict[str, Any]:
     """
@@ -1082,19 +1517,13 @@ def get_database_options() -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Database configuration options
     """
-    print("\n" + "=" * 60)
-    print("Database Schema Generation Configuration")
-    print("=" * 60)
-    
     options = {}
     
     # Database type
-    print("\nSelect database type:")
-    print("1. MySQL")
-    print("2. MariaDB")
+    sys.stdout.write(_DB_TYPE_MENU)
     
     while True:
-        db_choice = input("Choice [1]: ").strip()
+        db_choice = _prompt("Choice [1]: ")
         if not db_choice or db_choice == '1':
             options['db_type'] = DatabaseType.MYSQL
             break
@@ -1109,13 +1538,10 @@ def get_database_options() -> Dict[str, Any]:
     options['database_name'] = db_name if db_name else 'myproject_db'
     
     # Language selection
-    print("\nSelect source language:")
-    print("1. C (parse structs from .h files)")
-    print("2. C++ (parse classes from .hpp/.h files)")
-    print("3. Java (parse classes from .java files)")
+    sys.stdout.write(_DB_LANG_MENU)
     
     while True:
-        lang_choice = input("Choice [1]: ").strip()
+        lang_choice = _prompt("Choice [1]: ")
         if not lang_choice or lang_choice == '1':
             options['language'] = 'C'
             break
@@ -1133,11 +1559,58 @@ def get_database_options() -> Dict[str, Any]:
     options['output_file'] = output_file if output_file else 'schema.sql'
     
     # Include sample data
-    include_sample = input("Include sample INSERT statements? [y/N]: ").strip().lower()
+    include_sample = _prompt("Include sample INSERT statements? [y/N]: ").lower()
     options['include_sample_data'] = include_sample in ['y', 'yes']
     
     return options
 
+# SQL type names grouped by the sample INSERT value generated for them
+_SAMPLE_INT_TYPES = frozenset({'INT', 'BIGINT', 'SMALLINT', 'TINYINT', 'INT UNSIGNED', 'BIGINT UNSIGNED'})
+_SAMPLE_STR_TYPES = frozenset({'VARCHAR', 'TEXT', 'CHAR'})
+_SAMPLE_FLOAT_TYPES = frozenset({'FLOAT', 'DOUBLE', 'DECIMAL'})
+
+# Schema parser for each source language
+_SCHEMA_PARSERS = {
+    'C': CodeStructureParser.parse_c_structs,
+    'C++': CodeStructureParser.parse_cpp_classes,
+    'Java': CodeStructureParser.parse_java_classes,
+}
+
+# Smallest file count worth the startup cost of a worker process pool
+_PARALLEL_PARSE_MIN_FILES = 64
+
+def _parse_files(parse: Callable[[str], List[Table]], source_files: List[str]) -> Iterator[List[Table]]:
+    """
+    Parse source files, fanning large batches out to worker processes.
+    
+    Parsing is CPU-bound and each file is independent, so once there are
+    enough files to pay for process startup they are spread over a
+    ProcessPoolExecutor. Smaller batches, single-core machines and platforms
+    without working multiprocessing are parsed in this process.
+    
+    Args:
+        parse: One of the CodeStructureParser parse_* methods
+        source_files (List[str]): Paths to parse
+    
+    Returns:
+        Iterator[List[Table]]: Tables found in each file, in input order
+    """
+    executor = None
+    if len(source_files) >= _PARALLEL_PARSE_MIN_FILES and (os.cpu_count() or 1) > 1:
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor()
+        except (ImportError, NotImplementedError, OSError):
+            executor = None
+    
+    if executor is None:
+        for file_path in source_files:
+            yield parse(file_path)
+        return
+    
+    with executor:
+        yield from executor.map(parse, source_files, chunksize=8)
+
 def generate_database_schema(options: Dict[str, Any]):
     """
     Generate database schema from code structures.
@@ -1147,16 +1620,9 @@ def generate_database_schema(options: Dict[str, Any]):
     """
     print(f"\nGenerating {options['db_type']} schema from {options['language']} code...")
     
-    # Discover source files
-    if options['language'] == 'C':
-        source_files = glob.glob("**/*.h", recursive=True)
-    elif options['language'] == 'C++':
-        source_files = glob.glob("**/*.hpp", recursive=True) + glob.glob("**/*.h", recursive=True)
-    else:  # Java
-        source_files = glob.glob("**/*.java", recursive=True)
-    
-    # Filter out build directories
-    source_files = [f for f in source_files if not f.startswith(('obj/', 'build/', 'target/'))]
+    # Reuse the cached single-pass discovery; C and C++ definitions come from headers
+    src_files, header_files = get_source_files(options['language'])
+    source_files = src_files if options['language'] == 'Java' else header_files
     
     if not source_files:
         print(f"No {options['language']} source files found!")
@@ -1164,20 +1630,17 @@ def generate_database_schema(options: Dict[str, Any]):
     
     print(f"Found {len(source_files)} source files to analyze...")
     
-    # Parse structures/classes
-    all_tables = []
+    # Parse structures/classes, keeping the first definition of each table
+    # when a header declares the same struct or class as another
+    tables_by_name: Dict[str, Table] = {}
     
-    for file_path in source_files:
+    parse = _SCHEMA_PARSERS[options['language']]
+    for file_path, tables in zip(source_files, _parse_files(parse, source_files)):
         print(f"Parsing {file_path}...")
-        
-        if options['language'] == 'C':
-            tables = CodeStructureParser.parse_c_structs(file_path)
-        elif options['language'] == 'C++':
-            tables = CodeStructureParser.parse_cpp_classes(file_path)
-        else:  # Java
-            tables = CodeStructureParser.parse_java_classes(file_path)
-        
-        all_tables.extend(tables)
+        for table in tables:
+            tables_by_name.setdefault(table.name, table)
+    
+    all_tables = list(tables_by_name.values())
     
     if not all_tables:
         print("No structures/classes found to convert to database schema!")
@@ -1187,32 +1650,30 @@ def generate_database_schema(options: Dict[str, Any]):
     for table in all_tables:
         print(f"  - {table.name} ({len(table.fields)} fields)")
     
-    # Generate SQL
-    sql_content = SQLGenerator.generate_mysql_schema(all_tables, options['database_name'])
-    
-    # Add sample data if requested
-    if options['include_sample_data']:
-        sql_content += "\n-- Sample INSERT statements\n"
-        for table in all_tables:
-            sample_values = []
-            for field in table.fields:
-                if field.data_type.name.upper() in ['INT', 'BIGINT', 'SMALLINT']:
-                    sample_values.append('1')
-                elif field.data_type.name.upper() in ['VARCHAR', 'TEXT', 'CHAR']:
-                    sample_values.append(f"'sample_{field.name}'")
-                elif field.data_type.name.upper() == 'BOOLEAN':
-                    sample_values.append('TRUE')
-                elif field.data_type.name.upper() in ['FLOAT', 'DOUBLE']:
-                    sample_values.append('1.0')
-                else:
-                    sample_values.append('NULL')
-            
-            field_names = [f.name for f in table.fields]
-            sql_content += f"INSERT INTO `{table.name}` (`{'`, `'.join(field_names)}`) VALUES ({', '.join(sample_values)});\n"
-    
-    # Write to file
-    with open(options['output_file'], 'w') as f:
-        f.write(sql_content)
+    # Generate SQL straight into the output file
+    with open(options['output_file'], 'w', encoding='utf-8', buffering=1 << 16) as out:
+        SQLGenerator.write_mysql_schema(all_tables, out, options['database_name'])
+        
+        # Add sample data if requested
+        if options['include_sample_data']:
+            out.write("\n-- Sample INSERT statements\n")
+            for table in all_tables:
+                sample_values = []
+                for field in table.fields:
+                    type_name = field.data_type.name.upper()
+                    if type_name in _SAMPLE_INT_TYPES:
+                        sample_values.append('1')
+                    elif type_name in _SAMPLE_STR_TYPES:
+                        sample_values.append(f"'sample_{field.name}'")
+                    elif type_name == 'BOOLEAN':
+                        sample_values.append('TRUE')
+                    elif type_name in _SAMPLE_FLOAT_TYPES:
+                        sample_values.append('1.0')
+                    else:
+                        sample_values.append('NULL')
+                
+                field_names = [f.name for f in table.fields]
+                out.write(f"INSERT INTO `{table.name}` (`{'`, `'.join(field_names)}`) VALUES ({', '.join(sample_values)});\n")
     
     print(f"\nDatabase schema generated successfully!")
     print(f"Output file: {options['output_file']}")
@@ -1220,88 +1681,297 @@ def generate_database_schema(options: Dict[str, Any]):
     print(f"Tables: {len(all_tables)}")
 
 
-def get_source_files(lang: str) -> Tuple[List[str], List[str]]:
+def _walk_dirs(roots: List[str], ext_buckets: Dict[str, int],
+               subdirs: Optional[List[str]] = None) -> Tuple[List[str], List[str], Dict[str, int]]:
     """
-    Discover and categorize source files for the specified language.
+    Walk directory trees and bucket files by extension.
     
-    Recursively searches the current directory for source files matching
-    the specified language. Excludes files in build directories (obj/, build/)
-    to avoid including generated or temporary files.
+    Uses an explicit stack of os.scandir() calls so every directory is read
+    exactly once. Excluded build directories and hidden entries are pruned
+    before descending rather than filtered out afterwards.
     
     Args:
-        lang (str): Programming language ('C', 'C++', 'Java')
+        roots (List[str]): Directory prefixes to start from, '' being the
+            current directory
+        ext_buckets (Dict[str, int]): Extension without the dot (lowercase
+            except the C++ 'C' and 'H') mapped to 0 for sources or 1 for headers
+        subdirs (List[str], optional): When given, subdirectories are
+            collected here instead of being descended into
     
     Returns:
-        Tuple[List[str], List[str]]: A tuple containing:
-            - List of source files (.c, .cpp, .java)
-            - List of header files (.h, .hpp) or empty list for Java
+        Tuple[List[str], List[str], Dict[str, int]]: Source and header paths
+        relative to the current directory, and the st_mtime_ns of every
+        directory that was read
+    """
+    found = ([], [])
+    dir_mtimes = {}
+    stack = list(roots)
+    found_dirs = stack if subdirs is None else subdirs
+    
+    while stack:
+        prefix = stack.pop()
+        path = prefix or '.'
+        try:
+            # Stamp before listing so a change made mid-scan invalidates the result
+            dir_mtimes[path] = os.stat(path).st_mtime_ns
+            entries = os.scandir(path)
+        except OSError:
+            continue
+        
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.'):
+                    continue
+                path = os.path.join(prefix, name) if prefix else name
+                
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in _EXCLUDED_DIRS:
+                        found_dirs.append(path)
+                    continue
+                
+                _, dot, ext = name.rpartition('.')
+                if dot:
+                    if ext not in _CASE_SENSITIVE_EXTS:
+                        ext = ext.lower()
+                    bucket = ext_buckets.get(ext)
+                    if bucket is not None:
+                        found[bucket].append(path)
+    
+    return found[0], found[1], dir_mtimes
+
+def _walk_dirs_parallel(roots: List[str],
+                        ext_buckets: Dict[str, int]) -> List[Tuple[List[str], List[str], Dict[str, int]]]:
+    """
+    Walk directory trees on a pool of threads sharing one work queue.
     
-    File Extensions by Language:
-        - C: .c (source), .h (headers)
-        - C++: .cpp/.cc (source), .hpp/.h (headers)
-        - Java: .java (source), no headers
+    Each worker reads one directory at a time and queues its subdirectories
+    for whichever worker is free, so a single deep subtree is still spread
+    over the pool. os.scandir() releases the GIL while reading, which lets
+    directory latency overlap on network filesystems.
     
-    Example:
-        >>> src_files, header_files = get_source_files('C++')
-        >>> print(src_files)
-        ['main.cpp', 'utils.cpp', 'src/helper.cc']
-        >>> print(header_files)
-        ['utils.hpp', 'include/helper.h']
-    """
-    if lang == 'C':
-        src_files = glob.glob("**/*.c", recursive=True)
-        header_files = glob.glob("**/*.h", recursive=True)
-    elif lang == 'C++':
-        src_files = glob.glob("**/*.cpp", recursive=True) + glob.glob("**/*.cc", recursive=True)
-        header_files = glob.glob("**/*.hpp", recursive=True) + glob.glob("**/*.h", recursive=True)
-    else:  # Java
-        src_files = glob.glob("**/*.java", recursive=True)
-        header_files = []  # Java doesn't have separate header files
+    Args:
+        roots (List[str]): Directory prefixes to start from
+        ext_buckets (Dict[str, int]): Extension without the dot (lowercase
+            except the C++ 'C' and 'H') mapped to 0 for sources or 1 for headers
     
-    # Remove any files from subdirectories that start with 'obj/' or 'build/'
-    src_files = [f for f in src_files if not f.startswith(('obj/', 'build/'))]
-    header_files = [f for f in header_files if not f.startswith(('obj/', 'build/'))]
+    Returns:
+        List[Tuple[List[str], List[str], Dict[str, int]]]: Each worker's
+        source paths, header paths and directory mtimes
     
-    return src_files, header_files
-
-def generate_traditional_makefile(target_name: str, lang: str, arch: str = '64'):
+    Raises:
+        OSError: Or any other error a worker hit while reading a directory,
+            re-raised once every worker has stopped, just as the sequential
+            walk would raise it. No partial result is returned.
     """
-    Generate a traditional GNU Makefile for the specified language and architecture.
+    import queue
+    import threading
+    
+    pending = queue.Queue()
+    for root in roots:
+        pending.put(root)
+    results = []
+    errors = []
+    
+    def worker():
+        src_files, header_files, dir_mtimes = [], [], {}
+        while True:
+            prefix = pending.get()
+            if prefix is None:
+                break
+            try:
+                # After any failure the remaining directories are drained unread
+                if not errors:
+                    subdirs = []
+                    found_src, found_hdr, found_mtimes = _walk_dirs([prefix], ext_buckets, subdirs)
+                    src_files.extend(found_src)
+                    header_files.extend(found_hdr)
+                    dir_mtimes.update(found_mtimes)
+                    # Queue children before marking this directory done so
+                    # pending.join() cannot return while work remains
+                    for subdir in subdirs:
+                        pending.put(subdir)
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                pending.task_done()
+        results.append((src_files, header_files, dir_mtimes))
+    
+    workers = [threading.Thread(target=worker, daemon=True)
+               for _ in range(min(32, (os.cpu_count() or 1) * 4))]
+    for thread in workers:
+        thread.start()
+    try:
+        pending.join()
+    finally:
+        # On Ctrl+C the workers finish the queued directories and exit
+        for _ in workers:
+            pending.put(None)
+    for thread in workers:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+def _scan_sources(ext_buckets: Dict[str, int]) -> Tuple[List[str], List[str], Dict[str, int]]:
+    """
+    Walk the current directory once and bucket files by extension.
     
-    Creates a comprehensive Makefile with automatic dependency tracking,
-    proper compiler flags, and standard targets (all, clean, obj).
-    Supports C, C++, and Java with architecture-specific optimizations.
+    The top level is read first. When it has several subdirectories they
+    are walked on a thread pool, which hides per-directory latency on
+    network filesystems; small projects are walked in this thread. Paths
+    are sorted so the result does not depend on directory order or on
+    which worker found them.
     
     Args:
-        target_name (str): Name of the target executable/jar
-        lang (str): Programming language ('C', 'C++', 'Java')
-        arch (str, optional): Target architecture ('32', '64', 'native'). Defaults to '64'.
+        ext_buckets (Dict[str, int]): Extension without the dot (lowercase
+            except the C++ 'C' and 'H') mapped to 0 for sources or 1 for headers
     
     Returns:
-        None: Creates Makefile in current directory
+        Tuple[List[str], List[str], Dict[str, int]]: Source and header paths
+        relative to the current directory, and the st_mtime_ns of every
+        directory that was read
+    """
+    top_dirs = []
+    src_files, header_files, dir_mtimes = _walk_dirs([''], ext_buckets, top_dirs)
     
-    Generated Makefile Features:
-        - Automatic dependency generation
-        - Architecture-specific compiler flags
-        - Configurable compiler settings from config file
-        - Standard targets: all, clean, obj/build
-        - Incremental compilation support
-        - Cross-platform compatibility
+    if len(top_dirs) >= _PARALLEL_SCAN_MIN_DIRS:
+        results = _walk_dirs_parallel(top_dirs, ext_buckets)
+    else:
+        results = [_walk_dirs(top_dirs, ext_buckets)]
     
-    Example:
-        >>> generate_traditional_makefile('myapp', 'C++', '64')
-        # Creates Makefile with G++ compiler, 64-bit targeting
+    for found_src, found_hdr, found_mtimes in results:
+        src_files.extend(found_src)
+        header_files.extend(found_hdr)
+        dir_mtimes.update(found_mtimes)
+    src_files.sort()
+    header_files.sort()
+    return src_files, header_files, dir_mtimes
+
+def _dirs_unchanged(dir_mtimes: Dict[str, int]) -> bool:
     """
-    config = load_config()
+    Return True if every recorded directory still has the same st_mtime_ns.
     
-    if lang == 'C':
-        compiler = 'gcc'
-        src_ext = 'c'
-    elif lang == 'C++':
-        compiler = 'g++'
-        src_ext = 'cpp'
-    else:  # Java
-        makefile_content = """# Compiler settings
+    Every scan stamps the project root '.', so stamps without it (such as an
+    empty mapping from a truncated or hand-edited sidecar) are never trusted.
+    """
+    if '.' not in dir_mtimes:
+        return False
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in dir_mtimes.items())
+    except OSError:
+        return False
+
+def _load_source_cache():
+    """
+    Seed the source file cache from the sidecar in the current directory.
+    
+    Entries are still validated against directory modification times before
+    use, so a stale sidecar costs at most one rescan. A missing or malformed
+    sidecar is ignored.
+    
+    Returns:
+        None
+    """
+    cwd = os.getcwd()
+    try:
+        with open(_SOURCE_CACHE_FILE, 'rb') as f:
+            data = _json_loads(f.read())
+        entries = {}
+        for lang, entry in data['entries'].items():
+            dirs, src_files, header_files = entry['dirs'], entry['src'], entry['hdr']
+            if not (isinstance(dirs, dict) and isinstance(src_files, list) and isinstance(header_files, list)):
+                return
+            entries[(cwd, lang)] = (dirs, (src_files, header_files))
+    except Exception:
+        # The sidecar is only an optimization; fall back to scanning
+        return
+    _SOURCE_CACHE.update(entries)
+
+def _save_source_cache():
+    """
+    Write the cache entries of every changed directory to its sidecar.
+    
+    Creating the sidecar updates its directory's modification time, which
+    would invalidate the entries just written. When that happens the stamp
+    is refreshed and the file is rewritten in place, which does not touch
+    the directory again. Write errors are ignored.
+    
+    Returns:
+        None
+    """
+    for cwd in _SOURCE_CACHE_DIRTY:
+        entries = {
+            lang: {'dirs': dirs, 'src': src_files, 'hdr': header_files}
+            for (root, lang), (dirs, (src_files, header_files)) in _SOURCE_CACHE.items()
+            if root == cwd
+        }
+        path = os.path.join(cwd, _SOURCE_CACHE_FILE)
+        try:
+            before = os.stat(cwd).st_mtime_ns
+            _write_file(path, _json_dumps({'entries': entries}))
+            after = os.stat(cwd).st_mtime_ns
+            if after != before:
+                for entry in entries.values():
+                    if entry['dirs'].get('.') == before:
+                        entry['dirs']['.'] = after
+                _write_file(path, _json_dumps({'entries': entries}))
+        except OSError:
+            pass
+    _SOURCE_CACHE_DIRTY.clear()
+
+def get_source_files(lang: str) -> Tuple[List[str], List[str]]:
+    """
+    Discover and categorize source files for the specified language.
+    
+    Recursively searches the current directory for source files matching
+    the specified language in a single pass. Build directories (obj/,
+    build/, target/) and hidden directories are skipped at any depth to
+    avoid including generated or temporary files. Both lists are sorted,
+    so generated build files are stable from run to run.
+    
+    Results are cached per working directory and language. A cached list
+    is reused while none of the scanned directories has a new modification
+    time, which costs one stat() per directory instead of a full walk. The
+    cache is persisted to .maker-cache.json on exit and reloaded at startup.
+    
+    Args:
+        lang (str): Programming language ('C', 'C++', 'Java')
+    
+    Returns:
+        Tuple[List[str], List[str]]: A tuple containing:
+            - List of source files (.c, .cpp, .java)
+            - List of header files (.h, .hpp) or empty list for Java
+    
+    File Extensions by Language:
+        - C: .c (source), .h (headers)
+        - C++: .cpp/.cc/.cxx/.c++/.C (source), .hpp/.hh/.hxx/.h/.H (headers)
+        - Java: .java (source), no headers
+        Extensions are matched case-insensitively, except that upper-case
+        .C and .H are C++ files as under GCC.
+    
+    Example:
+        >>> src_files, header_files = get_source_files('C++')
+        >>> print(src_files)
+        ['main.cpp', 'src/helper.cc', 'utils.cpp']
+        >>> print(header_files)
+        ['include/helper.h', 'utils.hpp']
+    """
+    key = (os.getcwd(), lang)
+    cached = _SOURCE_CACHE.get(key)
+    if cached is not None and _dirs_unchanged(cached[0]):
+        return cached[1]
+    
+    # Java doesn't have separate header files
+    ext_buckets = _SOURCE_EXTENSIONS.get(lang, _SOURCE_EXTENSIONS['Java'])
+    src_files, header_files, dir_mtimes = _scan_sources(ext_buckets)
+    result = (src_files, header_files)
+    _SOURCE_CACHE[key] = (dir_mtimes, result)
+    _SOURCE_CACHE_DIRTY.add(key[0])
+    return result
+
+# Build file templates, filled in with str.format() by the generators below
+_MAKEFILE_JAVA_TMPL = """# Compiler settings
 JAVAC = javac
 JAVA = java
 JFLAGS = -d build
@@ -1333,26 +2003,9 @@ clean:
 	rm -rf build
 
 .PHONY: all clean run build
-""".format(target=target_name)
-        
-        with open('Makefile', 'w') as f:
-            f.write(makefile_content)
-        
-        if not os.path.exists('build'):
-            os.makedirs('build')
-        return
+"""
 
-    # For C/C++
-    arch_flag = ""
-    if arch == '32':
-        arch_flag = " -m32"
-    elif arch == '64':
-        arch_flag = " -m64"
-    
-    # Get compiler flags from config
-    base_flags = config['default_compiler_flags'].get(lang, '-Wall -Wextra')
-    
-    makefile_content = """# Compiler settings
+_MAKEFILE_C_TMPL = """# Compiler settings
 CC = {compiler}
 CFLAGS = {base_flags} -I.{arch_flag}
 
@@ -1393,58 +2046,9 @@ obj/%.d: %.{src_ext}
 	rm -f $@.$$$$
 
 .PHONY: all clean obj
-""".format(compiler=compiler, src_ext=src_ext, target=target_name, arch_flag=arch_flag, base_flags=base_flags)
+"""
 
-    with open('Makefile', 'w') as f:
-        f.write(makefile_content)
-    
-    if not os.path.exists('obj'):
-        os.makedirs('obj')
-
-def generate_cmake(target_name: str, src_files: List[str], header_files: List[str], lang: str, arch: str = '64'):
-    """
-    Generate CMake configuration files for the specified language and architecture.
-    
-    Creates a modern CMakeLists.txt with proper target configuration,
-    compiler flags, and installation rules. Supports C, C++, and Java
-    with architecture-specific optimizations and modern CMake practices.
-    
-    Args:
-        target_name (str): Name of the target executable/jar
-        src_files (List[str]): List of source file paths
-        header_files (List[str]): List of header file paths (unused for Java)
-        lang (str): Programming language ('C', 'C++', 'Java')
-        arch (str, optional): Target architecture ('32', '64', 'native'). Defaults to '64'.
-    
-    Returns:
-        None: Creates CMakeLists.txt in current directory
-    
-    Generated CMake Features:
-        - Modern CMake 3.10+ practices
-        - Language-specific standards (C11, C++17)
-        - Architecture-specific compiler flags
-        - Configurable compiler settings from config file
-        - Proper output directory organization
-        - Installation rules for deployment
-        - Java JAR creation support
-    
-    Example:
-        >>> src_files = ['main.cpp', 'utils.cpp']
-        >>> header_files = ['utils.h']
-        >>> generate_cmake('myapp', src_files, header_files, 'C++', '64')
-        # Creates CMakeLists.txt with modern C++17 configuration
-    """
-    config = load_config()
-    src_files_str = ' '.join(src_files)
-    
-    if lang == 'C':
-        lang_std = 'C_STANDARD 11'
-        project_lang = 'C'
-    elif lang == 'C++':
-        lang_std = 'CXX_STANDARD 17'
-        project_lang = 'CXX'
-    else:  # Java
-        cmake_content = """cmake_minimum_required(VERSION 3.10)
+_CMAKE_JAVA_TMPL = """cmake_minimum_required(VERSION 3.10)
 
 # Set project name
 project({target} Java)
@@ -1464,24 +2068,9 @@ add_jar(${{PROJECT_NAME}}
 
 # Install rules
 install_jar(${{PROJECT_NAME}} DESTINATION bin)
-""".format(target=target_name)
+"""
 
-        with open('CMakeLists.txt', 'w') as f:
-            f.write(cmake_content)
-        return
-
-    # For C/C++
-    arch_flags = ""
-    if arch == '32':
-        arch_flags = "\n# Set architecture to 32-bit\nset(CMAKE_C_FLAGS \"${CMAKE_C_FLAGS} -m32\")\nset(CMAKE_CXX_FLAGS \"${CMAKE_CXX_FLAGS} -m32\")"
-    elif arch == '64':
-        arch_flags = "\n# Set architecture to 64-bit\nset(CMAKE_C_FLAGS \"${CMAKE_C_FLAGS} -m64\")\nset(CMAKE_CXX_FLAGS \"${CMAKE_CXX_FLAGS} -m64\")"
-    
-    # Get compiler flags from config
-    base_flags = config['default_compiler_flags'].get(lang, '-Wall -Wextra')
-    cmake_flags = ' '.join([f'"{flag}"' for flag in base_flags.split()])
-    
-    cmake_content = """cmake_minimum_required(VERSION 3.10)
+_CMAKE_C_TMPL = """cmake_minimum_required(VERSION 3.10)
 
 # Set project name and language
 project({target} {lang})
@@ -1515,10 +2104,115 @@ target_include_directories(${{PROJECT_NAME}} PRIVATE
 install(TARGETS ${{PROJECT_NAME}}
     RUNTIME DESTINATION bin
 )
-""".format(target=target_name, lang=project_lang, lang_std=lang_std, sources=src_files_str, arch_flags=arch_flags, cmake_flags=cmake_flags)
+"""
+
+def generate_traditional_makefile(target_name: str, lang: str, arch: str,
+                                  config: Dict[str, Any]):
+    """
+    Generate a traditional GNU Makefile for the specified language and architecture.
+    
+    Creates a comprehensive Makefile with automatic dependency tracking,
+    proper compiler flags, and standard targets (all, clean, obj).
+    Supports C, C++, and Java with architecture-specific optimizations.
+    
+    Args:
+        target_name (str): Name of the target executable/jar
+        lang (str): Programming language ('C', 'C++', 'Java')
+        arch (str): Target architecture ('32', '64', 'native')
+        config (Dict[str, Any]): Configuration loaded once by the caller
+    
+    Returns:
+        None: Creates Makefile in current directory
+    
+    Generated Makefile Features:
+        - Automatic dependency generation
+        - Architecture-specific compiler flags
+        - Configurable compiler settings from config file
+        - Standard targets: all, clean, obj/build
+        - Incremental compilation support
+        - Cross-platform compatibility
+    
+    Example:
+        >>> generate_traditional_makefile('myapp', 'C++', '64', load_config())
+        # Creates Makefile with G++ compiler, 64-bit targeting
+    """
+    
+    if lang not in _LANG_SPEC:  # Java
+        makefile_content = _MAKEFILE_JAVA_TMPL.format(target=target_name)
+        
+        _write_if_changed('Makefile', makefile_content)
+        
+        os.makedirs('build', exist_ok=True)
+        return
+
+    # For C/C++
+    compiler, src_ext, _, _ = _LANG_SPEC[lang]
+    arch_flag = _ARCH_FLAG.get(arch, '')
+    
+    # Get compiler flags from config
+    base_flags = config['default_compiler_flags'].get(lang, '-Wall -Wextra')
+    
+    makefile_content = _MAKEFILE_C_TMPL.format(compiler=compiler, src_ext=src_ext, target=target_name, arch_flag=arch_flag, base_flags=base_flags)
+
+    _write_if_changed('Makefile', makefile_content)
+    
+    os.makedirs('obj', exist_ok=True)
+
+def generate_cmake(target_name: str, src_files: List[str], header_files: List[str], lang: str, arch: str,
+                   config: Dict[str, Any]):
+    """
+    Generate CMake configuration files for the specified language and architecture.
+    
+    Creates a modern CMakeLists.txt with proper target configuration,
+    compiler flags, and installation rules. Supports C, C++, and Java
+    with architecture-specific optimizations and modern CMake practices.
+    
+    Args:
+        target_name (str): Name of the target executable/jar
+        src_files (List[str]): List of source file paths
+        header_files (List[str]): List of header file paths (unused for Java)
+        lang (str): Programming language ('C', 'C++', 'Java')
+        arch (str): Target architecture ('32', '64', 'native')
+        config (Dict[str, Any]): Configuration loaded once by the caller
+    
+    Returns:
+        None: Creates CMakeLists.txt in current directory
+    
+    Generated CMake Features:
+        - Modern CMake 3.10+ practices
+        - Language-specific standards (C11, C++17)
+        - Architecture-specific compiler flags
+        - Configurable compiler settings from config file
+        - Proper output directory organization
+        - Installation rules for deployment
+        - Java JAR creation support
+    
+    Example:
+        >>> src_files = ['main.cpp', 'utils.cpp']
+        >>> header_files = ['utils.h']
+        >>> generate_cmake('myapp', src_files, header_files, 'C++', '64', load_config())
+        # Creates CMakeLists.txt with modern C++17 configuration
+    """
+    
+    if lang not in _LANG_SPEC:  # Java
+        cmake_content = _CMAKE_JAVA_TMPL.format(target=target_name)
+
+        _write_if_changed('CMakeLists.txt', cmake_content)
+        return
+
+    # For C/C++
+    _, _, lang_std, project_lang = _LANG_SPEC[lang]
+    arch_flags = _CMAKE_ARCH_FLAGS.get(arch, '')
+    
+    # Get compiler flags from config
+    base_flags = config['default_compiler_flags'].get(lang, '-Wall -Wextra')
+    cmake_flags = ' '.join(f'"{flag}"' for flag in base_flags.split())
+    # One source per line keeps the generated SOURCES list diff-friendly
+    src_files_str = '\n    '.join(src_files)
+    
+    cmake_content = _CMAKE_C_TMPL.format(target=target_name, lang=project_lang, lang_std=lang_std, sources=src_files_str, arch_flags=arch_flags, cmake_flags=cmake_flags)
 
-    with open('CMakeLists.txt', 'w') as f:
-        f.write(cmake_content)
+    _write_if_changed('CMakeLists.txt', cmake_content)
 
 def show_file_summary(src_files: List[str], header_files: List[str], lang: str):
     """
@@ -1555,29 +2249,62 @@ def show_file_summary(src_files: List[str], header_files: List[str], lang: str):
         Header Files (1):
           - utils.h
     """
-    print("\nSource Files Found:")
-    print("-" * 40)
-    if lang == 'Java':
-        print(f"Java Files ({len(src_files)}):")
-    else:
-        print(f"Source Files ({len(src_files)}):")
-    for f in src_files:
-        print(f"  - {f}")
+    # Assemble the whole listing and emit it with one write
+    kind = 'Java' if lang == 'Java' else 'Source'
+    lines = ["\nSource Files Found:", "-" * 40, f"{kind} Files ({len(src_files)}):"]
+    lines.extend(f"  - {f}" for f in src_files)
     
     if header_files:  # Only show header files for C/C++
-        print(f"\nHeader Files ({len(header_files)}):")
-        for f in header_files:
-            print(f"  - {f}")
-    print("\nPress Enter to continue...")
+        lines.append(f"\nHeader Files ({len(header_files)}):")
+        lines.extend(f"  - {f}" for f in header_files)
+    lines.append("\nPress Enter to continue...\n")
+    sys.stdout.write("\n".join(lines))
     input()
 
+# Sample project sources written by create_sample_files()
+_SAMPLE_C_MAIN = """#include "main.h"
+
+int main(int argc, char *argv[]) {
+    printf("Hello, World!\\n");
+    return 0;
+}"""
+
+_SAMPLE_C_HDR = """#ifndef MAIN_H
+#define MAIN_H
+
+#include <stdio.h>
+#include <stdlib.h>
+
+#endif // MAIN_H"""
+
+_SAMPLE_CPP_MAIN = """#include "main.hpp"
+
+int main(int argc, char* argv[]) {
+    std::cout << "Hello, World!" << std::endl;
+    return 0;
+}"""
+
+_SAMPLE_CPP_HDR = """#ifndef MAIN_HPP
+#define MAIN_HPP
+
+#include <iostream>
+#include <string>
+
+#endif // MAIN_HPP"""
+
+_SAMPLE_JAVA_MAIN = """public class {name} {{
+    public static void main(String[] args) {{
+        System.out.println("Hello, World!");
+    }}
+}}"""
+
 def create_sample_files(dir_name: str, lang: str):
     """
     Create a new project directory with sample source files and basic structure.
     
     Creates a project directory and populates it with language-appropriate
     sample files including main source file, headers (for C/C++), and README.
-    Directory creation behavior is controlled by configuration settings.
+    An existing directory is reused.
     
     Args:
         dir_name (str): Name of the project directory to create
@@ -1600,62 +2327,19 @@ def create_sample_files(dir_name: str, lang: str):
         >>> create_sample_files('calculator', 'C++')
         # Creates calculator/ directory with main.cpp, main.hpp, README.md
     """
-    config = load_config()
-    
-    if config['auto_create_directories']:
-        os.makedirs(dir_name, exist_ok=True)
-        os.chdir(dir_name)
-    else:
-        if not os.path.exists(dir_name):
-            os.makedirs(dir_name, exist_ok=True)
-        os.chdir(dir_name)
+    os.makedirs(dir_name, exist_ok=True)
+    os.chdir(dir_name)
     
     if lang == 'C':
-        with open('main.c', 'w') as f:
-            f.write("""#include "main.h"
-
-int main(int argc, char *argv[]) {
-    printf("Hello, World!\\n");
-    return 0;
-}""")
-        
-        with open('main.h', 'w') as f:
-            f.write("""#ifndef MAIN_H
-#define MAIN_H
-
-#include <stdio.h>
-#include <stdlib.h>
-
-#endif // MAIN_H""")
-            
+        files = [('main.c', _SAMPLE_C_MAIN), ('main.h', _SAMPLE_C_HDR)]
     elif lang == 'C++':
-        with open('main.cpp', 'w') as f:
-            f.write("""#include "main.hpp"
-
-int main(int argc, char* argv[]) {
-    std::cout << "Hello, World!" << std::endl;
-    return 0;
-}""")
-        
-        with open('main.hpp', 'w') as f:
-            f.write("""#ifndef MAIN_HPP
-#define MAIN_HPP
-
-#include <iostream>
-#include <string>
-
-#endif // MAIN_HPP""")
-            
+        files = [('main.cpp', _SAMPLE_CPP_MAIN), ('main.hpp', _SAMPLE_CPP_HDR)]
     else:  # Java
-        with open(f'{dir_name}.java', 'w') as f:
-            f.write(f"""public class {dir_name} {{
-    public static void main(String[] args) {{
-        System.out.println("Hello, World!");
-    }}
-}}""")
+        files = [(f'{dir_name}.java', _SAMPLE_JAVA_MAIN.format(name=dir_name))]
+    files.append(('README.md', f"# {dir_name}\nA new {lang} project."))
     
-    with open('README.md', 'w') as f:
-        f.write(f"# {dir_name}\nA new {lang} project.")
+    for path, content in files:
+        _write_file(path, content)
 
 def show_success_message(build_type: str, target_name: str, lang: str):
     """
@@ -1691,40 +2375,159 @@ def show_success_message(build_type: str, target_name: str, lang: str):
         3. cmake ..
         4. make
     """
-    print("\nSuccess! Build files generated successfully.")
-    print(f"Target name: {target_name}")
-    print(f"Language: {lang}")
+    lines = [
+        "\nSuccess! Build files generated successfully.",
+        f"Target name: {target_name}",
+        f"Language: {lang}",
+    ]
     
     if build_type == 'cmake':
-        print("\nTo build with CMake:")
+        lines += ["\nTo build with CMake:", "1. mkdir build", "2. cd build", "3. cmake ..", "4. make"]
         if lang == 'Java':
-            print("1. mkdir build")
-            print("2. cd build")
-            print("3. cmake ..")
-            print("4. make")
-            print("5. java -jar {target_name}.jar".format(target_name=target_name))
-        else:
-            print("1. mkdir build")
-            print("2. cd build")
-            print("3. cmake ..")
-            print("4. make")
+            lines.append(f"5. java -jar {target_name}.jar")
     else:  # traditional makefile
+        lines += ["\nTo build with Make:", "1. make"]
         if lang == 'Java':
-            print("\nTo build with Make:")
-            print("1. make")
-            print("\nTo run:")
-            print("2. make run")
-            print("\nTo clean:")
-            print("make clean")
+            lines += ["\nTo run:", "2. make run", "\nTo clean:"]
         else:
-            print("\nTo build with Make:")
-            print("1. make")
-            print("\nTo clean (aka recompile with headers):")
-            print("make clean")
+            lines.append("\nTo clean (aka recompile with headers):")
+        lines.append("make clean")
+    
+    lines.append("\nPress Enter to return to main menu...\n")
+    sys.stdout.write("\n".join(lines))
+    input()
+
+def _select_language() -> Optional[str]:
+    """
+    Prompt for a language from the shared language menu.
+    
+    Returns:
+        Optional[str]: 'C', 'C++' or 'Java', or None after reporting an invalid choice
+    """
+    lang = _LANG_CHOICES.get(_prompt(_LANG_PROMPT))
+    if lang is None:
+        print("\nInvalid language! Press Enter to try again...")
+        input()
+    return lang
+
+def _scan_sources_for(lang: str, require_sources: bool = True) -> Optional[Tuple[List[str], List[str]]]:
+    """
+    Discover source files for a menu action, reporting failures to the user.
     
+    Pressing Ctrl+C during the scan aborts it and returns to the main menu
+    instead of exiting the program.
+    
+    Args:
+        lang (str): Programming language ('C', 'C++', 'Java')
+        require_sources (bool): Treat an empty source list as an error
+    
+    Returns:
+        Optional[Tuple[List[str], List[str]]]: Source and header files, or None if aborted or empty
+    """
+    try:
+        src_files, header_files = get_source_files(lang)
+    except KeyboardInterrupt:
+        print("\nScan aborted. Press Enter to continue...")
+        input()
+        return None
+    
+    if require_sources and not src_files:
+        print(f"\nError: No {lang} source files found in the current directory!")
+        print("Press Enter to continue...")
+        input()
+        return None
+    return src_files, header_files
+
+def _handle_summary():
+    """Menu option 1: show the discovered source and header files."""
+    lang = _select_language()
+    if lang is None:
+        return
+    files = _scan_sources_for(lang, require_sources=False)
+    if files is not None:
+        show_file_summary(files[0], files[1], lang)
+
+def _handle_generate_makefile():
+    """Menu option 2: generate a traditional Makefile."""
+    lang = _select_language()
+    if lang is None or _scan_sources_for(lang) is None:
+        return
+    config = load_config()
+    target_name = get_target_name()
+    arch = get_target_architecture(config)
+    generate_traditional_makefile(target_name, lang, arch, config)
+    show_success_message('make', target_name, lang)
+
+def _handle_generate_cmake():
+    """Menu option 3: generate a CMakeLists.txt."""
+    lang = _select_language()
+    if lang is None:
+        return
+    files = _scan_sources_for(lang)
+    if files is None:
+        return
+    config = load_config()
+    target_name = get_target_name()
+    arch = get_target_architecture(config)
+    generate_cmake(target_name, files[0], files[1], lang, arch, config)
+    show_success_message('cmake', target_name, lang)
+
+def _handle_java_makefile():
+    """Menu option 4: generate the advanced Java Makefile."""
+    if _scan_sources_for('Java') is None:
+        return
+    config = load_config()
+    target_name = get_target_name()
+    java_options = get_java_build_options()
+    generate_advanced_java_makefile(target_name, java_options, config)
+    show_success_message('make', target_name, 'Java')
+
+def _handle_new_project():
+    """Menu option 5: create a sample project. Never scans for sources."""
+    config = load_config()
+    dir_name = get_dir_name(config)
+    lang = _select_language()
+    if lang is None:
+        return
+    create_sample_files(dir_name, lang)
+    print(f"\nNew {lang} project '{dir_name}' created successfully!")
     print("\nPress Enter to return to main menu...")
     input()
 
+def _handle_database_schema():
+    """Menu option 7: generate a database schema from code structures."""
+    options = get_database_options()
+    generate_database_schema(options)
+    print("\nPress Enter to return to main menu...")
+    input()
+
+def _handle_rescan():
+    """Menu option 8: discard cached source file lists."""
+    _SOURCE_CACHE_DIRTY.update(cwd for cwd, _ in _SOURCE_CACHE)
+    _SOURCE_CACHE.clear()
+    print("\nSource file cache cleared. Files will be rescanned on next use.")
+    print("Press Enter to continue...")
+    input()
+
+def _handle_exit():
+    """Menu option 9: leave the application."""
+    clear_screen()
+    print("Thank you for using Build System Generator!")
+    sys.exit(0)
+
+# Main menu choice -> handler; only the build and summary handlers scan for sources
+_MENU_HANDLERS = {
+    '1': _handle_summary,
+    '2': _handle_generate_makefile,
+    '3': _handle_generate_cmake,
+    '4': _handle_java_makefile,
+    '5': _handle_new_project,
+    '6': manage_config,
+    '7': _handle_database_schema,
+    '8': _handle_rescan,
+    '9': _handle_exit,
+}
+
 def main_menu():
     """
     Main application menu and control loop.
@@ -1742,7 +2545,8 @@ def main_menu():
         5. Start new project - Create project template
         6. Configuration Management - Modify settings
         7. Generate database schema - Generate database schema from code
-        8. Exit - Quit the application
+        8. Rescan source files - Discard cached source file lists
+        9. Exit - Quit the application
     
     Returns:
         None: Runs until user selects exit option
@@ -1765,99 +2569,26 @@ def main_menu():
         5. Start new project
         6. Configuration Management
         7. Generate database schema
-        8. Exit
+        8. Rescan source files
+        9. Exit
     """
     while True:
         clear_screen()
         print_header()
         
-        print("Main Menu:")
-        print("1. Show source files summary")
-        print("2. Generate traditional Makefile")
-        print("3. Generate CMake files")
-        print("4. Generate advanced Java Makefile")
-        print("5. Start new project")
-        print("6. Configuration Management")
-        print("7. Generate database schema")
-        print("8. Exit")
-        print("\nChoice: ", end='')
-        
-        choice = input().strip()
-        
-        if choice in ['1', '2', '3']:
-            print("\nSelect language:")
-            print("1. C")
-            print("2. C++")
-            print("3. Java")
-            lang_choice = input("\nChoice: ").strip()
-            lang = {'1': 'C', '2': 'C++', '3': 'Java'}[lang_choice]
-            
-            src_files, header_files = get_source_files(lang)
-            
-            if not src_files and choice in ['2', '3']:
-                print(f"\nError: No {lang} source files found in the current directory!")
-                print("Press Enter to continue...")
-                input()
-                continue
-        
-        if choice == '4':
-            # Advanced Java Makefile generation
-            src_files, header_files = get_source_files('Java')
-            
-            if not src_files:
-                print("\nError: No Java source files found in the current directory!")
-                print("Press Enter to continue...")
-                input()
-                continue
-        
-        if choice == '1':
-            show_file_summary(src_files, header_files, lang)
-        elif choice == '2':
-            target_name = get_target_name()
-            arch = get_target_architecture()
-            generate_traditional_makefile(target_name, lang, arch)
-            show_success_message('make', target_name, lang)
-        elif choice == '3':
-            target_name = get_target_name()
-            arch = get_target_architecture()
-            generate_cmake(target_name, src_files, header_files, lang, arch)
-            show_success_message('cmake', target_name, lang)
-        elif choice == '4':
-            target_name = get_target_name()
-            java_options = get_java_build_options()
-            generate_advanced_java_makefile(target_name, java_options)
-            show_success_message('make', target_name, 'Java')
-        elif choice == '5':
-            dir_name = get_dir_name()
-            print("\nSelect language:")
-            print("1. C")
-            print("2. C++")
-            print("3. Java")
-            lang_choice = input("\nChoice: ").strip()
-            lang = {'1': 'C', '2': 'C++', '3': 'Java'}[lang_choice]
-            
-            create_sample_files(dir_name, lang)
-            print(f"\nNew {lang} project '{dir_name}' created successfully!")
-            print("\nPress Enter to return to main menu...")
-            input()
-        elif choice == '6':
-            manage_config()
-        elif choice == '7':
-            options = get_database_options()
-            generate_database_schema(options)
-            print("\nPress Enter to return to main menu...")
-            input()
-        elif choice == '8':
-            clear_screen()
-            print("Thank you for using Build System Generator!")
-            sys.exit(0)
-        else:
+        handler = _MENU_HANDLERS.get(_prompt(_MENU_STR))
+        if handler is None:
             print("\nInvalid choice! Press Enter to try again...")
             input()
+            continue
+        handler()
 
 if __name__ == "__main__":
+    _load_source_cache()
     try:
         main_menu()
     except KeyboardInterrupt:
         print("\nProgram interrupted by user. Exiting...")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+    finally:
+        _save_source_cache()
\ No newline at end of file
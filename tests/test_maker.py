@@ -0,0 +1,307 @@
+"""
+Regression tests for source discovery, configuration handling, code structure
+parsing and schema generation.
+
+Run from the repository root with:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import maker
+
+
+def _field_names(tables):
+    """Return {table name: [field names]} for a list of parsed tables."""
+    return {table.name: [field.name for field in table.fields] for table in tables}
+
+
+class TempDirTestCase(unittest.TestCase):
+    """Base class that writes files to a fresh temporary directory."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def write(self, name, text):
+        path = os.path.join(self._tmp.name, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def chdir_to_tmp(self):
+        """Make the temporary directory the working directory for this test."""
+        cwd = os.getcwd()
+        os.chdir(self._tmp.name)
+        self.addCleanup(os.chdir, cwd)
+
+
+class SourceDiscoveryTests(TempDirTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.chdir_to_tmp()
+        self.addCleanup(maker._SOURCE_CACHE.clear)
+        self.addCleanup(maker._SOURCE_CACHE_DIRTY.clear)
+
+    def test_upper_case_c_and_h_are_cpp_files(self):
+        for name in ('a.C', 'b.c', 'c.H', 'd.h'):
+            self.write(name, '')
+        self.assertEqual(maker.get_source_files('C'), (['b.c'], ['d.h']))
+        self.assertEqual(maker.get_source_files('C++'), (['a.C'], ['c.H', 'd.h']))
+
+    def test_sidecar_entry_without_root_stamp_is_rescanned(self):
+        self.write('main.c', '')
+        self.write(maker._SOURCE_CACHE_FILE,
+                   '{"entries": {"C": {"dirs": {}, "src": ["ghost.c"], "hdr": []}}}')
+        maker._load_source_cache()
+        self.assertEqual(maker.get_source_files('C'), (['main.c'], []))
+
+    def test_sidecar_round_trip(self):
+        self.write('main.c', '')
+        self.write(os.path.join('src', 'a.c'), '')
+        found = maker.get_source_files('C')
+        maker._save_source_cache()
+        self.assertTrue(os.path.exists(maker._SOURCE_CACHE_FILE))
+
+        maker._SOURCE_CACHE.clear()
+        maker._load_source_cache()
+        dir_mtimes, cached = maker._SOURCE_CACHE[(os.getcwd(), 'C')]
+        self.assertEqual(cached, found)
+        # Writing the sidecar touched the root, but its stamp was refreshed
+        self.assertTrue(maker._dirs_unchanged(dir_mtimes))
+        with mock.patch.object(maker, '_scan_sources', side_effect=AssertionError('rescanned')):
+            self.assertEqual(maker.get_source_files('C'), found)
+
+        self.write(os.path.join('src', 'b.c'), '')
+        self.assertFalse(maker._dirs_unchanged(dir_mtimes))
+        self.assertEqual(maker.get_source_files('C'),
+                         (['main.c', os.path.join('src', 'a.c'), os.path.join('src', 'b.c')], []))
+
+    def write_tree(self):
+        """Lay out four top-level directories with pruned ones below them."""
+        for name in ('main.c', 'build/top.c',
+                     'src/a.c', 'src/build/gen.c', 'src/deep/er/b.c',
+                     'lib/x/y/util.c', 'lib/x/obj/o.c', 'lib/.git/hook.c',
+                     'include/z.h', 'include/target/t.h',
+                     'tools/t.c', 'tools/.hidden/h.c', 'tools/node_modules/n.c'):
+            self.write(name, '')
+
+    def test_threaded_walk_matches_sequential_walk(self):
+        self.write_tree()
+        buckets = maker._SOURCE_EXTENSIONS['C']
+        with mock.patch.object(maker, '_walk_dirs_parallel', wraps=maker._walk_dirs_parallel) as parallel:
+            threaded = maker._scan_sources(buckets)
+        parallel.assert_called_once()
+        with mock.patch.object(maker, '_PARALLEL_SCAN_MIN_DIRS', float('inf')):
+            sequential = maker._scan_sources(buckets)
+        self.assertEqual(threaded, sequential)
+        self.assertEqual(threaded[:2],
+                         ([os.path.join('lib', 'x', 'y', 'util.c'), 'main.c',
+                           os.path.join('src', 'a.c'), os.path.join('src', 'deep', 'er', 'b.c'),
+                           os.path.join('tools', 't.c')],
+                          [os.path.join('include', 'z.h')]))
+
+    def test_threaded_walk_reraises_worker_errors(self):
+        self.write_tree()
+        walk_dirs = maker._walk_dirs
+
+        def failing_walk(roots, *args, **kwargs):
+            if roots == ['lib']:
+                raise PermissionError('lib')
+            return walk_dirs(roots, *args, **kwargs)
+
+        with mock.patch.object(maker, '_walk_dirs', failing_walk):
+            with self.assertRaises(PermissionError):
+                maker.get_source_files('C')
+        self.assertNotIn((os.getcwd(), 'C'), maker._SOURCE_CACHE)
+
+
+@unittest.skipIf(os.name == 'nt', 'POSIX permission bits')
+class SaveConfigTests(TempDirTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.chdir_to_tmp()
+        self.addCleanup(maker._invalidate_config)
+
+    def test_save_keeps_existing_file_mode(self):
+        self.write('maker_config.json', '{}')
+        os.chmod('maker_config.json', 0o600)
+        with contextlib.redirect_stdout(io.StringIO()):
+            maker.save_config({'default_architecture': '64'})
+        self.assertEqual(os.stat('maker_config.json').st_mode & 0o777, 0o600)
+
+
+class ConfigCacheTests(TempDirTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.chdir_to_tmp()
+        self.addCleanup(maker._invalidate_config)
+
+    def test_new_project_directory_has_its_own_config(self):
+        self.write('maker_config.json', '{"default_architecture": "32"}')
+        self.assertEqual(maker.load_config()['default_architecture'], '32')
+
+        maker.create_sample_files('fresh', 'C')
+        self.assertEqual(maker.load_config()['default_architecture'], '64')
+
+        os.chdir(self._tmp.name)
+        self.write(os.path.join('own', 'maker_config.json'), '{"default_architecture": "native"}')
+        maker.create_sample_files('own', 'C')
+        self.assertEqual(maker.load_config()['default_architecture'], 'native')
+
+
+class CStructParsingTests(TempDirTestCase):
+
+    def test_semicolon_in_comment_does_not_start_a_field(self):
+        path = self.write('legacy.h',
+                          "typedef struct {\n"
+                          "    // legacy; int old;\n"
+                          "    int id;\n"
+                          "} Legacy;\n")
+        tables = maker.CodeStructureParser.parse_c_structs(path)
+        self.assertEqual(_field_names(tables), {'legacy': ['id']})
+
+    def test_declarator_list_gives_one_field_per_name(self):
+        path = self.write('point.h',
+                          "typedef struct {\n"
+                          "    int a;\n"
+                          "    int b, c;\n"
+                          "    char *name, tag;\n"
+                          "} Point;\n")
+        tables = maker.CodeStructureParser.parse_c_structs(path)
+        self.assertEqual(_field_names(tables), {'point': ['a', 'b', 'c', 'name', 'tag']})
+        types = {field.name: field.data_type.name for field in tables[0].fields}
+        self.assertEqual(types['name'], 'VARCHAR')
+        self.assertEqual(types['tag'], 'CHAR')
+
+
+class CppClassParsingTests(TempDirTestCase):
+
+    def test_class_in_comment_is_not_a_definition(self):
+        path = self.write('util.hpp',
+                          "// Helper class utilities\n"
+                          "namespace util { int global_count; double ratio; }\n")
+        self.assertEqual(maker.CodeStructureParser.parse_cpp_classes(path), [])
+
+    def test_class_with_base_list_on_next_line(self):
+        path = self.write('derived.hpp',
+                          "class Derived final : public Base, private Other<int>\n"
+                          "{\n"
+                          "    int id;\n"
+                          "    std::string name;\n"
+                          "};\n")
+        tables = maker.CodeStructureParser.parse_cpp_classes(path)
+        self.assertEqual(_field_names(tables), {'derived': ['id', 'name']})
+
+    def parse_members(self, *members):
+        """Parse a class with the given member lines; return [(name, SQL type)]."""
+        path = self.write('members.hpp',
+                          "class Members {\n"
+                          + "".join(f"    {member}\n" for member in members)
+                          + "};\n")
+        tables = maker.CodeStructureParser.parse_cpp_classes(path)
+        return [(field.name, field.data_type.name) for table in tables for field in table.fields]
+
+    def test_trailing_const_is_not_a_name(self):
+        self.assertEqual(self.parse_members("const int* const p;",
+                                            "int const* const q;",
+                                            "std::string const name;",
+                                            "char *label;"),
+                         [('p', 'TEXT'), ('q', 'TEXT'), ('name', 'VARCHAR'), ('label', 'VARCHAR')])
+
+    def test_declarator_list_gives_one_field_per_name(self):
+        self.assertEqual(self.parse_members("int a, b, *c;",
+                                            "double balance = 0.0, rate = 1.5;"),
+                         [('a', 'INT'), ('b', 'INT'), ('c', 'TEXT'),
+                          ('balance', 'DOUBLE'), ('rate', 'DOUBLE')])
+
+    def test_multi_word_integer_types(self):
+        self.assertEqual(self.parse_members("unsigned int count;",
+                                            "unsigned flags;",
+                                            "long long id;",
+                                            "unsigned long long big;"),
+                         [('count', 'INT UNSIGNED'), ('flags', 'INT UNSIGNED'),
+                          ('id', 'BIGINT'), ('big', 'BIGINT UNSIGNED')])
+
+    def test_template_types(self):
+        self.assertEqual(self.parse_members("std::map<int, std::string> lookup;",
+                                            "std::vector<std::pair<int, int>> pairs;"),
+                         [('lookup', 'TEXT'), ('pairs', 'TEXT')])
+
+    def test_static_and_constexpr_members_are_skipped(self):
+        self.assertEqual(self.parse_members("static int instances;",
+                                            "static constexpr int kMax = 5;",
+                                            "int constant_total;"),
+                         [('constant_total', 'INT')])
+
+
+
+_SCHEMA_TABLES_SQL = """\
+-- Table: users
+-- Registered users
+CREATE TABLE IF NOT EXISTS `users` (
+    `id` INT NOT NULL AUTO_INCREMENT,
+    `name` VARCHAR(255) COMMENT 'Display name',
+    `balance` DECIMAL(10) DEFAULT 0,
+    PRIMARY KEY (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Table: orders
+CREATE TABLE IF NOT EXISTS `orders` (
+    `id` BIGINT NOT NULL AUTO_INCREMENT,
+    `user_id` INT,
+    PRIMARY KEY (`id`),
+    FOREIGN KEY (`user_id`) REFERENCES `users`(`user_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Table: audit
+CREATE TABLE IF NOT EXISTS `audit` (
+
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+"""
+
+
+class SQLGeneratorTests(unittest.TestCase):
+
+    maxDiff = None
+
+    def tables(self):
+        """A commented table with a primary key, one with a foreign key, and an empty one."""
+        return [
+            maker.Table('users', [
+                maker.Field('id', maker.DataType('INT', nullable=False), is_primary_key=True),
+                maker.Field('name', maker.DataType('VARCHAR', 255), comment='Display name'),
+                maker.Field('balance', maker.DataType('DECIMAL', 10), default_value='0'),
+            ], comment='Registered users'),
+            maker.Table('orders', [
+                maker.Field('id', maker.DataType('BIGINT', nullable=False), is_primary_key=True),
+                maker.Field('user_id', maker.DataType('INT'), is_foreign_key=True, foreign_table='users'),
+            ]),
+            maker.Table('audit', []),
+        ]
+
+    def test_schema_with_database_name(self):
+        self.assertEqual(maker.SQLGenerator.generate_mysql_schema(self.tables(), 'shop'),
+                         "-- Database: shop\n"
+                         "CREATE DATABASE IF NOT EXISTS `shop`;\n"
+                         "USE `shop`;\n"
+                         "\n" + _SCHEMA_TABLES_SQL)
+
+    def test_schema_without_database_name(self):
+        self.assertEqual(maker.SQLGenerator.generate_mysql_schema(self.tables()), _SCHEMA_TABLES_SQL)
+
+
+if __name__ == '__main__':
+    unittest.main()